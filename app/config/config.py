@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from decouple import config
 
@@ -14,53 +15,86 @@ BASE_DIR = Path(__file__).resolve().parent.parent  # Points to project root
 IS_TESTING = "pytest" in sys.modules or any("pytest" in arg for arg in sys.argv)
 
 # -------------------- ACCESSORS -------------------- #
+# Settings are resolved once per process and cached; call cache_clear() to
+# re-read the environment (values copied at import time are unaffected).
+_cached_settings = []
+
+def _setting(func):
+    """Caches an accessor and registers it with cache_clear()."""
+    cached = lru_cache(maxsize=None)(func)
+    _cached_settings.append(cached)
+    return cached
+
+def cache_clear():
+    """Drops all cached settings so the next access re-reads the environment.
+
+    Meant for tests that change environment variables at runtime. Modules
+    that copied a setting into a constant at import time keep the old value.
+    """
+    for accessor in _cached_settings:
+        accessor.cache_clear()
 
 # App
+@_setting
 def get_port():
     return config("PORT", default=8000, cast=int)
 
 # Authentication
+@_setting
 def get_secret_key():
     return config("SECRET_KEY", default="default_secret")  # Avoid exposing secrets
 
+@_setting
 def get_algorithm():
     return config("ALGORITHM", default="HS256")
 
+@_setting
 def get_access_token_expiry():
     return config("ACCESS_TOKEN_EXPIRE_MINUTES", default=(10 if IS_TESTING else 60), cast=int)
 
 # Database
+@_setting
 def get_db_name():
     return config("DB_NAME", default=("TEST_SKIN_DIAGNOSIS_DB" if IS_TESTING else "Skin_Cancer_Diagnosis"))
 
+@_setting
 def get_mongo_cluster():
     return config("MONGO_CLUSTER", default="default_cluster.mongodb.net")
 
+@_setting
 def get_mongo_username():
     return config("MONGO_USERNAME", default="default_user")
 
+@_setting
 def get_mongo_password():
     return config("MONGO_PASSWORD", default="default_password")
 
+@_setting
 def get_cases_collection():
     return config("CASES_DB_COLLECTION", default="Cases")
 
+@_setting
 def get_doctors_collection():
     return config("DOCTORS_DB_COLLECTION", default="Doctors")
 
+@_setting
 def get_patients_collection():
     return config("PATIENTS_DB_COLLECTION", default="Patients")
 
+@_setting
 def get_api_keys_collection():
     return config("API_DB_COLLECTION", default="Users-API-Keys")
 
+@_setting
 def get_images_collection():
     return config("IMAGES_DB_COLLECTION", default="Images")
 
+@_setting
 def get_ml_api_url():
     return config("ML_API_URL", default="http://localhost:8000/predict")
 
 # Security & Cryptography
+@_setting
 def get_bcrypt_salt_rounds():
     return config("BCRYPT_SALT_ROUNDS", default=12, cast=int)
 
@@ -68,6 +102,7 @@ def get_bcrypt_salt_rounds():
 def is_testing():
     return IS_TESTING
 
+@_setting
 def is_logging_enabled():
     return config("LOGGING_ENABLED", default=True, cast=bool)
 
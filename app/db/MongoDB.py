@@ -1,6 +1,7 @@
 """MongoDB connection handler for the Skin Diagnosis System API."""
 
 import logging
+import os
 from typing import Optional
 
 from app.config import config as env
@@ -37,6 +38,10 @@ class MongoDBHandler:
 
         self.MONGO_URI = f"mongodb+srv://{self.MONGO_USERNAME}:{self.MONGO_PASSWORD}@{self.MONGO_CLUSTER}"
         self.client: Optional[MongoClient] = None
+        # (database, collection) -> Collection bound to the current client,
+        # plus the PID that created them so forked workers start afresh.
+        self._collections: dict = {}
+        self._collections_pid: Optional[int] = None
 
     def connect(self):
         """Establishes a persistent connection to the MongoDB database.
@@ -45,9 +50,13 @@ class MongoDBHandler:
             ConnectionFailure: If the database connection cannot be established.
         """
         if not self.client:
+            self._collections.clear()
             try:
+                # UUIDs are stored as 16-byte BSON binary (subtype 4)
                 self.client = MongoClient(
-                    self.MONGO_URI, serverSelectionTimeoutMS=5000
+                    self.MONGO_URI,
+                    serverSelectionTimeoutMS=5000,
+                    uuidRepresentation="standard",
                 )
                 # Trigger exception if connection fails
                 self.client.admin.command("ping")
@@ -61,6 +70,7 @@ class MongoDBHandler:
         if self.client:
             self.client.close()
             self.client = None
+            self._collections.clear()
             print("Disconnected from MongoDB successfully")
 
     def get_database(self, database: str = None) -> Database:
@@ -81,7 +91,7 @@ class MongoDBHandler:
                 "Not connected to MongoDB. Call connect() first."
             )
 
-        logging.info(f"Getting database: {database}")
+        logger.debug("Getting database: %s", database)
 
         db = self.client[database or self.DB_NAME]
         return db
@@ -100,6 +110,37 @@ class MongoDBHandler:
         """
         db = self.get_database(database)
 
-        logging.info(f"Getting collection: {collection_name}")
+        logger.debug("Getting collection: %s", collection_name)
         collection = db[collection_name]
         return collection
+
+    def get_cached_collection(
+        self, collection_name: str, database: str = None
+    ) -> Collection:
+        """Retrieves a collection, reusing its handle while connected.
+
+        Handles are dropped on connect() and disconnect(), so a reconnect
+        never returns a collection bound to a closed client, and a forked
+        worker never reuses its parent's handles.
+
+        Args:
+            collection_name (str): The name of the collection to retrieve.
+            database (str, optional): The name of the database. Defaults to the DB_NAME.
+
+        Returns:
+            Collection: The MongoDB collection instance.
+
+        Raises:
+            ConnectionFailure: If not connected to MongoDB.
+        """
+        pid = os.getpid()
+        if self._collections_pid != pid:
+            self._collections.clear()
+            self._collections_pid = pid
+
+        key = (database or self.DB_NAME, collection_name)
+        collection = self._collections.get(key)
+        if collection is None:
+            collection = self.get_collection(collection_name, database)
+            self._collections[key] = collection
+        return collection
@@ -4,11 +4,16 @@ import logging
 from app.config import logging_config
 from app.config.db_init import db_handler
 from app.middleware.authentication import AuthMiddleware
+from app.middleware.request_cache import RequestCacheMiddleware
+from app.models.case import ensure_case_indexes
+from app.models.doctor import ensure_doctor_indexes
+from app.models.patient import ensure_patient_indexes
 from app.routers import cases
 from app.routers import users
 from fastapi import FastAPI
 from fastapi import Security
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.security import HTTPBearer
 import uvicorn
@@ -21,9 +26,14 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Lifespan event handler to manage application startup and shutdown.
 
-    Connects to MongoDB on startup and disconnects on shutdown.
+    Connects to MongoDB and ensures collection indexes on startup, so the
+    first request does not pay for the connection handshake, and
+    disconnects on shutdown.
     """
     db_handler.connect()  # Connect to MongoDB on startup
+    ensure_doctor_indexes()
+    ensure_patient_indexes()
+    ensure_case_indexes()
     yield
     db_handler.disconnect()  # Disconnect from MongoDB on shutdown
     logger.warning("Application shutdown: Disconnected from MongoDB")
@@ -40,6 +50,7 @@ def create_app() -> FastAPI:
         description="API for diagnosing skin conditions using AI.",
         version="1.0.0",
         lifespan=lifespan,  # Register lifespan handler
+        default_response_class=ORJSONResponse,
     )
 
     # Define a security scheme using HTTP Bearer
@@ -57,6 +68,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Give each request its own lookup cache (outermost middleware)
+    app.add_middleware(RequestCacheMiddleware)
+
     # Include routers
     app.include_router(users.router, prefix="/users", tags=["Users"])
     app.include_router(cases.router, prefix="/cases", tags=["Cases"])
@@ -0,0 +1,20 @@
+from app.utils.request_cache import end_request_cache
+from app.utils.request_cache import start_request_cache
+
+
+class RequestCacheMiddleware:
+    """ASGI middleware giving each HTTP request its own lookup cache."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request_cache()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end_request_cache(token)
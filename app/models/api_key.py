@@ -4,10 +4,10 @@ from datetime import datetime
 from datetime import timedelta
 import logging
 import secrets
-import uuid
 
 from app.config import config as env
 from app.config.db_init import db_handler
+from app.schema import new_id
 from fastapi import HTTPException
 from fastapi import status
 from pymongo.collection import Collection
@@ -19,6 +19,8 @@ logger = logging.getLogger(__name__)
 def get_api_key_collection() -> Collection:
     """Retrieves the MongoDB API key collection.
 
+    The handle is reused until the database handler reconnects.
+
     Returns:
         Collection: The MongoDB collection storing API keys.
 
@@ -26,17 +28,9 @@ def get_api_key_collection() -> Collection:
         HTTPException: 500 if the database collection is unavailable.
     """
     try:
-        collection = db_handler.get_collection(
+        return db_handler.get_cached_collection(
             collection_name=env.get_api_keys_collection(), database="Users"
         )
-        if collection is None:
-            logger.error("API key collection is unavailable.")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database connection failed.",
-            )
-
-        return collection
 
     except Exception as e:
         logger.exception(
@@ -146,7 +140,7 @@ def allocate_api_key(doctor_id: str) -> str:
 
         # Prepare the API key record
         api_key_data = {
-            "api_key_id": str(uuid.uuid4()),
+            "api_key_id": new_id(),
             "doctor_id": doctor_id,
             "api_key": api_key,
             "created_at": created_at.strftime("%Y-%m-%d %H:%M:%S"),
@@ -4,26 +4,34 @@
 
 import logging
 import uuid
-from datetime import datetime, timezone
 from typing import List, Optional
 
 import gridfs
 import requests
 from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.responses import Response
+import msgspec
+from pymongo import IndexModel
 from pymongo.collection import Collection
 
 from app.config import config as env
 from app.config.db_init import db_handler
 from app.models.api_key import get_api_key
 from app.models.patient import get_patient_id
+from app.schema import new_id, utc_now
 from app.schema.case import Case, DiagnosisResult
 from app.schema.images import UploadImage
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Binary encoding offered to service clients that accept it
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_msgpack_encoder = msgspec.msgpack.Encoder()
+
 
 def get_fs() -> gridfs.GridFS:
     """Initializes and returns a GridFS instance for handling large files.
@@ -32,7 +40,7 @@ def get_fs() -> gridfs.GridFS:
         gridfs.GridFS: The GridFS instance connected to the Images database.
     """
     try:
-        logger.info("Connecting to 'Images' database.")
+        logger.debug("Connecting to 'Images' database.")
         db = db_handler.get_database("Images")
 
         if db is None:
@@ -59,29 +67,44 @@ def get_fs() -> gridfs.GridFS:
 def get_case_collection() -> Collection:
     """Retrieves the MongoDB case collection.
 
+    The handle is reused until the database handler reconnects.
+
     Returns:
         Collection: The MongoDB collection for cases.
     """
-    db = db_handler.get_collection(
+    return db_handler.get_cached_collection(
         collection_name=env.get_cases_collection(), database="Cases"
     )
 
-    if db is None:
-        logger.error("Cases collection is unavailable.")
-        raise Exception("Cases collection is unavailable.")
 
-    logger.info("Successfully retrieved cases collection.")
-    return db
+def ensure_case_indexes() -> None:
+    """Creates the indexes backing case lookups by ID, doctor and patient.
+
+    Failures are logged rather than raised so the API can still start.
+    """
+    try:
+        get_case_collection().create_indexes(
+            [
+                IndexModel([("case_id", 1)], unique=True),
+                IndexModel([("doctor_id", 1), ("created_at", -1)]),
+                IndexModel([("patient_id", 1), ("created_at", -1)]),
+            ]
+        )
+        logger.info("Case indexes ensured.")
+    except Exception as e:
+        logger.error("Failed to create case indexes: %s", str(e))
 
 
-def get_case_by_id(case_id: str) -> JSONResponse:
+def get_case_by_id(case_id: str, as_msgpack: bool = False) -> Response:
     """Retrieve a case from the database using its unique ID.
 
     Args:
         case_id (str): The unique identifier of the case.
+        as_msgpack (bool): Encode the case as MessagePack instead of JSON.
+            Defaults to False.
 
     Returns:
-        JSONResponse: The case details as a JSON response.
+        Response: The case details as a JSON or MessagePack response.
     """
     try:
         case = get_case_collection().find_one({"case_id": case_id}, {"_id": 0})
@@ -90,24 +113,32 @@ def get_case_by_id(case_id: str) -> JSONResponse:
             logger.warning("Case with ID %s not found.", case_id)
             raise HTTPException(status_code=404, detail="Case not found")
 
-        case_data = jsonable_encoder(Case(**case))
+        case_data = Case(**case).model_dump(mode="json")
         logger.info("Successfully retrieved case ID: %s", case_id)
 
-        return JSONResponse(content=case_data, status_code=status.HTTP_200_OK)
+        if as_msgpack:
+            return Response(
+                content=_msgpack_encoder.encode(case_data),
+                status_code=status.HTTP_200_OK,
+                media_type=MSGPACK_MEDIA_TYPE,
+            )
+        return ORJSONResponse(
+            content=case_data, status_code=status.HTTP_200_OK
+        )
 
     except Exception as e:
         logger.exception("Error retrieving case ID %s: %s", case_id, str(e))
         raise HTTPException(status_code=500, detail="Error retrieving case.")
 
 
-def get_cases_by_doctor(doctor: dict) -> JSONResponse:
+def get_cases_by_doctor(doctor: dict) -> ORJSONResponse:
     """Retrieve all cases assigned to a specific doctor.
 
     Args:
         doctor (dict): Doctor details.
 
     Returns:
-        JSONResponse: A list of case documents.
+        ORJSONResponse: A list of case documents.
     """
     try:
         doctor_id = doctor["doctor_id"]
@@ -118,7 +149,7 @@ def get_cases_by_doctor(doctor: dict) -> JSONResponse:
 
         if not cases_list:
             logger.warning("No cases found for doctor ID %s.", doctor_id)
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"cases": []}, status_code=status.HTTP_200_OK
             )
 
@@ -130,7 +161,7 @@ def get_cases_by_doctor(doctor: dict) -> JSONResponse:
                 }
 
         processed_cases = [
-            jsonable_encoder(Case(**case)) for case in cases_list
+            Case(**case).model_dump(mode="json") for case in cases_list
         ]
         logger.info(
             "Retrieved %d case(s) for doctor ID: %s",
@@ -138,7 +169,7 @@ def get_cases_by_doctor(doctor: dict) -> JSONResponse:
             doctor_id,
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={"cases": processed_cases}, status_code=status.HTTP_200_OK
         )
 
@@ -156,7 +187,7 @@ def generate_unique_filename(extension: str = "jpg") -> str:
     Returns:
         str: A unique filename.
     """
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    timestamp = utc_now().strftime("%Y%m%d%H%M%S")
     unique_id = uuid.uuid4().hex[:8]
     return f"image_{timestamp}_{unique_id}.{extension}"
 
@@ -175,8 +206,12 @@ async def get_diagnosis(file: bytes, api_key: str) -> DiagnosisResult:
         headers = {"access_token": api_key}
         files = {"file": file}
 
-        response = requests.post(
-            env.get_ml_api_url(), files=files, timeout=30, headers=headers
+        response = await run_in_threadpool(
+            requests.post,
+            env.get_ml_api_url(),
+            files=files,
+            timeout=30,
+            headers=headers,
         )
         logger.info("Received response from ML API: %s", response.status_code)
 
@@ -239,22 +274,33 @@ def get_case_image(image_id: str) -> bytes:
         raise HTTPException(status_code=500, detail="Error retrieving image.")
 
 
-def get_cases_by_patient(patient_id: str) -> JSONResponse:
+def get_cases_by_patient(patient_id: str) -> ORJSONResponse:
     """Retrieve all cases associated with a specific patient.
 
     Args:
         patient_id (str): The unique identifier of the patient.
 
     Returns:
-        JSONResponse: A JSON response containing a list of cases associated with the patient.
+        ORJSONResponse: A JSON response containing a list of cases associated with the patient.
 
     Raises:
+        HTTPException: 400 if the patient ID is not a valid UUID.
         HTTPException: 404 if no cases are found for the patient.
         HTTPException: 500 if there is an error retrieving the cases.
     """
     try:
+        try:
+            patient_uuid = uuid.UUID(patient_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid patient ID.",
+            )
+
+        # Cases created before patient IDs were stored as binary UUIDs
+        # still hold the string form.
         cases_cursor = get_case_collection().find(
-            {"patient_id": patient_id}, {"_id": 0}
+            {"patient_id": {"$in": [patient_uuid, patient_id]}}, {"_id": 0}
         )
         cases_list = list(cases_cursor)
 
@@ -270,8 +316,8 @@ def get_cases_by_patient(patient_id: str) -> JSONResponse:
             len(cases_list),
             patient_id,
         )
-        return JSONResponse(
-            content={"cases": jsonable_encoder(cases_list)},
+        return ORJSONResponse(
+            content={"cases": cases_list},
             status_code=status.HTTP_200_OK,
         )
 
@@ -294,9 +340,12 @@ async def create_case(
     case_notes: Optional[List[str]],
     file: UploadFile,
     current_doctor: dict,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create a new diagnosis case by processing an uploaded image.
 
+    This coroutine runs on the event loop, so every blocking MongoDB, GridFS
+    and ML API call is offloaded to the threadpool.
+
     Args:
         patient_number (int): The unique identifier of the patient.
         case_notes (Optional[List[str]]): Notes related to the case.
@@ -304,7 +353,7 @@ async def create_case(
         current_doctor (dict): Information about the doctor submitting the case.
 
     Returns:
-        JSONResponse: A JSON response containing the case details upon successful creation.
+        ORJSONResponse: A JSON response containing the case details upon successful creation.
 
     Raises:
         HTTPException: 400 if invalid input is provided.
@@ -349,7 +398,7 @@ async def create_case(
             )
 
         # Retrieve patient ID
-        patient_id = get_patient_id(patient_number)
+        patient_id = await run_in_threadpool(get_patient_id, patient_number)
         if not patient_id:
             logger.warning("Patient not found: %s", patient_number)
             raise HTTPException(
@@ -358,13 +407,13 @@ async def create_case(
             )
 
         # Upload the image to GridFS
-        image_id = upload_case_image(image_data)
+        image_id = await run_in_threadpool(upload_case_image, image_data)
         logger.info(
             "Image uploaded successfully to GridFS with ID: %s", image_id
         )
 
         # Fetch doctor's API key for ML diagnosis
-        doctor_api_key = get_api_key(doctor_id)
+        doctor_api_key = await run_in_threadpool(get_api_key, doctor_id)
         if not doctor_api_key:
             logger.error("Doctor does not have a valid API key.")
             raise HTTPException(
@@ -378,19 +427,19 @@ async def create_case(
 
         # Prepare case data for storage
         case_data = {
-            "case_id": str(uuid.uuid4()),
+            "case_id": new_id(),
             "doctor_id": doctor_id,
             "patient_id": patient_id,
             "patient_number": int(patient_number),
             "diagnosis": diagnosis["diagnosis"][0],
             "notes": case_notes if case_notes else [""],
             "image_id": image_id,
-            "created_at": datetime.now(timezone.utc),
+            "created_at": utc_now(),
         }
 
         # Insert case data into MongoDB
         cases = get_case_collection()
-        result = cases.insert_one(case_data)
+        result = await run_in_threadpool(cases.insert_one, case_data)
         if not result.acknowledged:
             logger.error("Database insert for case not acknowledged.")
             raise HTTPException(
@@ -403,8 +452,8 @@ async def create_case(
         )
         case_data.pop("_id")
         logger.info("Case Data: %s", case_data)
-        return JSONResponse(
-            content={"status": "success", "case": jsonable_encoder(case_data)},
+        return ORJSONResponse(
+            content={"status": "success", "case": case_data},
             status_code=status.HTTP_201_CREATED,
         )
 
@@ -1,29 +1,83 @@
 """Doctor management module for handling authentication, profile creation, and retrieval."""
 
-from datetime import datetime
-from datetime import timezone
 import logging
-import uuid
+import threading
+import time
 
 from app.config import config as env
 from app.config.db_init import db_handler
 from app.models.api_key import allocate_api_key
+from app.schema import new_id
+from app.schema import utc_now
 from app.schema.doctor import DoctorCreate
+from app.utils.request_cache import request_cached
+from cachetools import TTLCache
 from fastapi import HTTPException
 from fastapi import Request
+from fastapi import Response
 from fastapi import status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from pydantic_core import to_json
+from pymongo import IndexModel
 from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Verified bearer token -> (token expiry, doctor document). Entries also
+# honour the token's own "exp" claim, which may be sooner than the TTL.
+_doctor_token_cache = TTLCache(maxsize=5_000, ttl=60)
+_doctor_token_cache_lock = threading.Lock()
+
+# Lower-cased email -> login credentials, so repeated logins skip MongoDB.
+# Only found doctors are cached; bcrypt verification always runs.
+_credentials_cache = TTLCache(maxsize=1_024, ttl=60)
+_credentials_cache_lock = threading.Lock()
+
+# (source, message) pairs that recently triggered a 401, used to de-duplicate
+# log lines. Entries expire individually, so a full cache never resets them
+# all at once.
+_UNAUTH_LOG_TTL_SECONDS = 60.0
+_UNAUTH_LOG_MAX_SOURCES = 10_000
+_recent_unauthorized = TTLCache(
+    maxsize=_UNAUTH_LOG_MAX_SOURCES, ttl=_UNAUTH_LOG_TTL_SECONDS
+)
+_recent_unauthorized_lock = threading.Lock()
+
+
+def _log_unauthorized(request: Request, message: str, *args) -> None:
+    """Logs a rejected authentication attempt at ERROR once per TTL.
+
+    Repeats of the same message from the same source within the TTL are
+    logged at DEBUG instead.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        message (str): The log message format string.
+        *args: Arguments for the log message.
+    """
+    source = request.client.host if request.client else "unknown"
+    # Keyed per failure kind, so one source behind a shared proxy or NAT
+    # cannot mask a different kind of auth failure.
+    key = (source, message)
+    with _recent_unauthorized_lock:
+        repeated = key in _recent_unauthorized
+        if not repeated:
+            _recent_unauthorized[key] = True
+
+    if repeated:
+        logger.debug(message, *args)
+    else:
+        logger.error(message, *args)
+
 
 def get_doctor_collection() -> Collection:
     """
     Retrieves the MongoDB doctor collection.
 
+    The handle is reused until the database handler reconnects.
+
     Returns:
         Collection: MongoDB collection for doctors.
 
@@ -31,59 +85,73 @@ def get_doctor_collection() -> Collection:
         Exception: If the doctor collection cannot be retrieved.
     """
     try:
-        db = db_handler.get_collection(
+        return db_handler.get_cached_collection(
             collection_name=env.get_doctors_collection(), database="Users"
         )
-        if db is None:
-            error_message = "Doctor collection is unavailable."
-            logging.error(error_message)
-            raise Exception(error_message)
-        logging.info("Got doctor collection: %s", db)
-        return db
 
     except Exception as e:
-        logging.exception("Failed to retrieve doctor collection: %s", str(e))
+        logger.exception("Failed to retrieve doctor collection: %s", str(e))
         raise
 
 
-def create_doctor(doctor_info: DoctorCreate) -> JSONResponse:
+def ensure_doctor_indexes() -> None:
+    """Creates the unique email index used by login and registration.
+
+    Failures are logged rather than raised so the API can still start.
+    """
+    try:
+        get_doctor_collection().create_indexes(
+            [IndexModel([("email", 1)], unique=True)]
+        )
+        logger.info("Doctor indexes ensured.")
+    except Exception as e:
+        logger.error("Failed to create doctor indexes: %s", str(e))
+
+
+def create_doctor(doctor_info: DoctorCreate) -> Response:
     """Creates a new doctor in the database.
 
+    The response body is serialized in a single pass by pydantic-core, since
+    the document was just built server-side and needs no re-validation.
+
     Args:
         doctor_info (DoctorCreate): The validated doctor details.
 
     Returns:
-        JSONResponse: A JSON response containing the created doctor profile.
+        Response: A JSON response containing the created doctor profile.
 
     Raises:
+        HTTPException: 400 if the email is already registered.
         HTTPException: 500 if database insertion fails.
     """
     from app.utils.authentication import hash_password
 
     try:
-        logger.info("Doctor registration input: %s", doctor_info.model_dump())
-
-        existing_doctor = get_doctor_by_email(doctor_info.email)
-        if existing_doctor:
-            logger.error("Email is already registered: %s", doctor_info.email)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email is already registered.",
-            )
+        logger.debug(
+            "Doctor registration request for email: %s", doctor_info.email
+        )
 
         logger.info("Creating doctor profile for email: %s", doctor_info.email)
 
         doctors = get_doctor_collection()
 
         doctor_data = {
-            "doctor_id": str(uuid.uuid4()),
-            "email": doctor_info.email.lower(),
+            "doctor_id": new_id(),
+            "email": doctor_info.email,
             "name": doctor_info.name.title(),
             "password": hash_password(doctor_info.password),
-            "created_at": datetime.now(timezone.utc),
+            "created_at": utc_now(),
         }
 
-        result = doctors.insert_one(doctor_data)
+        # The unique email index rejects duplicates atomically.
+        try:
+            result = doctors.insert_one(doctor_data)
+        except DuplicateKeyError:
+            logger.error("Email is already registered: %s", doctor_info.email)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email is already registered.",
+            )
         if not result.acknowledged:
             logger.error(
                 "Database insert for doctor %s not acknowledged.",
@@ -103,11 +171,15 @@ def create_doctor(doctor_info: DoctorCreate) -> JSONResponse:
         logger.info(
             "Doctor created successfully with id: %s", doctor_data["doctor_id"]
         )
-        return JSONResponse(
-            content=jsonable_encoder(doctor_data),
+        return Response(
+            content=to_json(doctor_data),
             status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
         )
 
+    except HTTPException as http_err:
+        raise http_err
+
     except Exception as e:
         logger.exception("Error creating doctor: %s", str(e))
         raise HTTPException(
@@ -116,6 +188,7 @@ def create_doctor(doctor_info: DoctorCreate) -> JSONResponse:
         )
 
 
+@request_cached
 def get_doctor_by_id(doctor_id: str) -> dict:
     """Retrieves a doctor by their UUID.
 
@@ -130,11 +203,11 @@ def get_doctor_by_id(doctor_id: str) -> dict:
     )
 
 
-def get_all_doctors() -> JSONResponse:
+def get_all_doctors() -> ORJSONResponse:
     """Retrieves all doctors from the database.
 
     Returns:
-        JSONResponse: A JSON response containing a list of doctors.
+        ORJSONResponse: A JSON response containing a list of doctors.
 
     Raises:
         HTTPException: 500 if an error occurs.
@@ -142,8 +215,8 @@ def get_all_doctors() -> JSONResponse:
     try:
         doctors = get_doctor_collection()
         doctor_list = list(doctors.find({}, {"_id": 0, "password": 0}))
-        return JSONResponse(
-            content={"doctors": jsonable_encoder(doctor_list)},
+        return ORJSONResponse(
+            content={"doctors": doctor_list},
             status_code=status.HTTP_200_OK,
         )
     except Exception as e:
@@ -160,16 +233,49 @@ def get_doctor_by_email(email: str) -> dict:
         email (str): The doctor's email address.
 
     Returns:
-        dict: The doctor object if found, otherwise None.
+        dict: The doctor object (without the password hash) if found,
+            otherwise None.
     """
     return get_doctor_collection().find_one(
-        {"email": email.lower()}, {"_id": 0}
+        {"email": email.lower()}, {"_id": 0, "password": 0}
+    )
+
+
+def get_doctor_credentials(email: str) -> dict:
+    """Retrieves only the fields needed to authenticate a doctor.
+
+    Results are served from a short-lived in-process cache when available.
+
+    Args:
+        email (str): The doctor's email address.
+
+    Returns:
+        dict: The doctor's ``doctor_id``, ``email`` and ``password`` hash if
+            found, otherwise None.
+    """
+    # Emails are stored lower-cased; key the cache the same way.
+    email = email.lower()
+    with _credentials_cache_lock:
+        credentials = _credentials_cache.get(email)
+    if credentials is not None:
+        return credentials
+
+    credentials = get_doctor_collection().find_one(
+        {"email": email},
+        {"_id": 0, "doctor_id": 1, "email": 1, "password": 1},
     )
+    if credentials is not None:
+        with _credentials_cache_lock:
+            _credentials_cache[email] = credentials
+    return credentials
 
 
 def get_current_doctor(request: Request) -> dict:
     """Extracts and verifies the current doctor from the JWT token.
 
+    Verified tokens are cached for up to a minute (never past their own
+    expiry), so repeat requests skip JWT decoding and the doctor lookup.
+
     Args:
         request (Request): The incoming HTTP request.
 
@@ -181,34 +287,54 @@ def get_current_doctor(request: Request) -> dict:
     """
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
-        logger.error("Missing or invalid Authorization header.")
+        _log_unauthorized(request, "Missing or invalid Authorization header.")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing or invalid Authorization header.",
         )
 
     token = auth_header.split(" ")[1]
-    logger.info("Authorization header found. Extracting token.")
+    logger.debug("Authorization header found. Extracting token.")
+
+    with _doctor_token_cache_lock:
+        cached = _doctor_token_cache.get(token)
+    if cached is not None:
+        expires_at, doctor = cached
+        if expires_at is None or expires_at > time.time():
+            # Hand out a copy so no caller can alter the cached snapshot.
+            return dict(doctor)
+        with _doctor_token_cache_lock:
+            _doctor_token_cache.pop(token, None)
 
     from app.utils.authentication import verify_token
 
     try:
         doctor_data = verify_token(token)
-        logger.info("JWT token verified successfully.")
+        logger.debug("JWT token verified successfully.")
 
         doctor = get_doctor_by_id(doctor_data.get("id"))
         if not doctor:
-            logger.error("Doctor with id %s not found.", doctor_data.get("id"))
+            _log_unauthorized(
+                request, "Doctor with id %s not found.", doctor_data.get("id")
+            )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Doctor not found.",
             )
 
-        logger.info("Doctor authenticated successfully.")
+        with _doctor_token_cache_lock:
+            _doctor_token_cache[token] = (
+                doctor_data.get("exp"),
+                dict(doctor),
+            )
+
+        logger.debug("Doctor authenticated successfully.")
         return doctor
 
     except HTTPException as http_err:
-        logger.error("Token verification error: %s", http_err.detail)
+        _log_unauthorized(
+            request, "Token verification error: %s", http_err.detail
+        )
         raise http_err
 
     except Exception as e:
@@ -217,4 +343,4 @@ def get_current_doctor(request: Request) -> dict:
         )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token."
-        )
+        ) from None
@@ -1,29 +1,42 @@
 """MongoDB model for managing patient data."""
 
 from datetime import date
-from datetime import datetime
-from datetime import timezone
 import logging
+import threading
+from typing import Iterator, List, Optional
 import uuid
 
 from app.config import config as env
 from app.config.db_init import db_handler
+from app.schema import utc_now
 from app.schema.patient import PatientCreate
+from app.utils.request_cache import request_cached
+from cachetools import TTLCache
 from fastapi import HTTPException
 from fastapi import status
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.responses import StreamingResponse
+import orjson
 from pydantic import ValidationError
 import pymongo
+from pymongo import IndexModel
 from pymongo.collection import Collection
+from pymongo.cursor import Cursor
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# patient_number -> patient_id lookups; the mapping never changes once a
+# patient is registered, so entries are only bounded by size and age.
+_patient_id_cache = TTLCache(maxsize=10_000, ttl=300)
+_patient_id_cache_lock = threading.Lock()
+
 
 def get_patient_collection() -> Collection:
     """Retrieves the MongoDB patient collection.
 
+    The handle is reused until the database handler reconnects.
+
     Returns:
         Collection: The MongoDB collection for patients.
 
@@ -31,25 +44,58 @@ def get_patient_collection() -> Collection:
         Exception: If the patient collection cannot be retrieved.
     """
     try:
-        db = db_handler.get_collection(
+        return db_handler.get_cached_collection(
             collection_name=env.get_patients_collection(), database="Users"
         )
-        logger.info("Database: %s", env.get_patients_collection())
-        if db is None:
-            logger.error("Patient collection is unavailable.")
-            raise Exception("Patient collection is unavailable.")
-
-        logger.info("Successfully retrieved patient collection.")
-        return db
 
     except Exception as e:
         logger.exception("Failed to retrieve patient collection: %s", str(e))
         raise
 
 
+def ensure_patient_indexes() -> None:
+    """Creates the unique indexes backing patient lookups and inserts.
+
+    ``patient_number`` is unique so that duplicate registrations are rejected
+    by the insert itself, and ``patient_id`` is unique for direct lookups.
+    Failures are logged rather than raised so the API can still start.
+    """
+    try:
+        get_patient_collection().create_indexes(
+            [
+                IndexModel([("patient_number", 1)], unique=True),
+                IndexModel([("patient_id", 1)], unique=True),
+            ]
+        )
+        logger.info("Patient indexes ensured.")
+    except Exception as e:
+        logger.error("Failed to create patient indexes: %s", str(e))
+
+
+def _patient_document(patient_info: PatientCreate) -> dict:
+    """Builds the stored document for a validated patient.
+
+    Text fields are already normalized by the schema; the date of birth is
+    stored as a YYYY-MM-DD string and ``patient_id`` as a binary UUID.
+
+    Args:
+        patient_info (PatientCreate): The validated patient details.
+
+    Returns:
+        dict: The document to insert into the patient collection.
+    """
+    return {
+        "patient_id": uuid.uuid4(),
+        **patient_info.model_dump(),
+        "date_of_birth": patient_info.date_of_birth.strftime("%Y-%m-%d"),
+        "notes": patient_info.notes or None,
+        "created_at": utc_now(),
+    }
+
+
 def create_patient(
     patient_info: PatientCreate, current_doctor: dict
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Creates a new patient profile in the database.
 
@@ -58,20 +104,24 @@ def create_patient(
         current_doctor (dict): The currently logged-in doctor's details obtained via get_current_doctor.
 
     Returns:
-        JSONResponse: A JSON response containing either the created patient object
-                      or an error message.
+        ORJSONResponse: A JSON response containing the created patient object.
+
+    Raises:
+        HTTPException: 400 if the input is invalid or the patient number exists.
+        HTTPException: 401 if the doctor has no valid identifier.
+        HTTPException: 422 if the patient details fail validation.
+        HTTPException: 500 if the database insert fails.
     """
     try:
-        logger.info("Creating patient profile for name: %s", patient_info.name)
+        logger.debug("Creating patient profile for name: %s", patient_info.name)
 
         # Ensure doctor_id is present
         doctor_id = current_doctor.get("doctor_id") or current_doctor.get("id")
         if not doctor_id:
             error_message = "Current doctor does not have a valid identifier."
             logger.error(error_message)
-            return JSONResponse(
-                content={"status": "error", "message": error_message},
-                status_code=status.HTTP_401_UNAUTHORIZED,
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail=error_message
             )
 
         # Retrieve patient collection
@@ -82,92 +132,59 @@ def create_patient(
         if not patient_number:
             raise ValueError("Patient number cannot be empty.")
 
-        name = patient_info.name.strip().title()
-
-        # Validate and Format Date of Birth (YYYY-MM-DD)
-        try:
-            if isinstance(patient_info.date_of_birth, date):
-                date_of_birth = patient_info.date_of_birth.strftime(
-                    "%Y-%m-%d"
-                )  # ✅ Convert to YYYY-MM-DD string
-            else:
-                raise ValueError(
-                    "Invalid date_of_birth format. Expected YYYY-MM-DD."
-                )
-        except Exception as dob_error:
-            logger.error("Invalid date_of_birth: %s", str(dob_error))
-            return JSONResponse(
-                content={
-                    "status": "error",
-                    "message": "Invalid date_of_birth format. Expected YYYY-MM-DD.",
-                },
-                status_code=status.HTTP_400_BAD_REQUEST,
+        # Validate Date of Birth (stored as YYYY-MM-DD)
+        if not isinstance(patient_info.date_of_birth, date):
+            logger.error(
+                "Invalid date_of_birth: %s", patient_info.date_of_birth
             )
-
-        gender = patient_info.gender.lower()
-        country = patient_info.country.title() if patient_info.country else None
-        occupation = (
-            patient_info.occupation.title() if patient_info.occupation else None
-        )
-        ethnicity = (
-            patient_info.ethnicity.title() if patient_info.ethnicity else None
-        )
-        notes = patient_info.notes if patient_info.notes else None
-
-        # Check for duplicate patient_number
-        if patients.find_one({"patient_number": patient_number}):
-            error_message = f"Patient number {patient_number} already exists."
-            logger.warning(error_message)
-            return JSONResponse(
-                content={"status": "error", "message": error_message},
+            raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid date_of_birth format. Expected YYYY-MM-DD.",
             )
 
         # Prepare patient data
-        patient_data = {
-            "patient_id": str(uuid.uuid4()),
-            "patient_number": patient_number,
-            "name": name,
-            "date_of_birth": date_of_birth,  # ✅ Now formatted correctly
-            "gender": gender,
-            "country": country,
-            "occupation": occupation,
-            "ethnicity": ethnicity,
-            "notes": notes,
-            "created_at": datetime.now(timezone.utc),
-        }
-
-        # Insert into the database
+        patient_data = _patient_document(patient_info)
+
+        # Insert into the database; the unique index on patient_number
+        # rejects duplicates without a separate lookup.
         try:
             result = patients.insert_one(patient_data)
             if not result.acknowledged:
                 raise pymongo.errors.OperationFailure(
                     "Database insert not acknowledged."
                 )
+        except pymongo.errors.DuplicateKeyError:
+            error_message = f"Patient number {patient_number} already exists."
+            logger.warning(error_message)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=error_message
+            )
         except pymongo.errors.PyMongoError as db_error:
             logger.error(
                 "Database error while inserting patient: %s", str(db_error)
             )
-            return JSONResponse(
-                content={
-                    "status": "error",
-                    "message": "Database error occurred while creating the patient.",
-                },
+            raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database error occurred while creating the patient.",
             )
 
         patient_data.pop("_id", None)
+        with _patient_id_cache_lock:
+            _patient_id_cache.pop(patient_number, None)
 
         logger.info(
             "Patient created successfully with patient_number: %s",
             patient_data["patient_number"],
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(patient_data),
+        return ORJSONResponse(
+            content=patient_data,
             status_code=status.HTTP_201_CREATED,
         )
 
+    except HTTPException as http_err:
+        raise http_err
+
     except ValidationError as ve:
         # Extract field-specific validation errors
         errors = ve.errors()
@@ -180,44 +197,148 @@ def create_patient(
             for err in errors
         ]
         logger.error("Validation error: %s", error_details)
-        return JSONResponse(
-            content={"status": "error", "errors": error_details},
+        raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=error_details,
         )
 
     except ValueError as ve:
         logger.warning("Validation error: %s", str(ve))
-        return JSONResponse(
-            content={"status": "error", "message": str(ve)},
-            status_code=status.HTTP_400_BAD_REQUEST,
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve)
         )
 
     except KeyError as ke:
         logger.error("Missing required data: %s", str(ke))
-        return JSONResponse(
-            content={
-                "status": "error",
-                "message": f"Missing required data: {str(ke)}",
-            },
+        raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Missing required data: {str(ke)}",
         )
 
     except Exception as e:
         logger.exception("Unexpected error: %s", str(e))
-        return JSONResponse(
-            content={
-                "status": "error",
-                "message": "An unexpected error occurred.",
-            },
+        raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
         )
 
 
-def get_all_patients() -> JSONResponse:
-    """Retrieves all patient profiles.
+def create_patients_bulk(
+    patient_infos: List[PatientCreate], current_doctor: dict
+) -> ORJSONResponse:
+    """Registers several patients with a single database roundtrip.
+
+    The insert is unordered, so one duplicate patient number does not stop
+    the remaining patients from being registered.
+
+    Args:
+        patient_infos (List[PatientCreate]): The validated patient details.
+        current_doctor (dict): The currently logged-in doctor's details obtained via get_current_doctor.
 
     Returns:
-        JSONResponse: A JSON response containing the list of patients.
+        ORJSONResponse: A JSON response listing the inserted patients and the
+            patient numbers rejected as duplicates.
+
+    Raises:
+        HTTPException: 401 if the doctor has no valid identifier.
+        HTTPException: 500 if the database insert fails.
+    """
+    doctor_id = current_doctor.get("doctor_id") or current_doctor.get("id")
+    if not doctor_id:
+        error_message = "Current doctor does not have a valid identifier."
+        logger.error(error_message)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=error_message
+        )
+
+    docs = [_patient_document(patient_info) for patient_info in patient_infos]
+
+    try:
+        patients = get_patient_collection()
+        patients.insert_many(docs, ordered=False)
+        failed = {}
+
+    except pymongo.errors.BulkWriteError as bwe:
+        write_errors = bwe.details.get("writeErrors", [])
+        if any(err.get("code") != 11000 for err in write_errors):
+            logger.error("Bulk patient insert failed: %s", write_errors)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database error occurred while creating patients.",
+            )
+        failed = {err["index"]: err for err in write_errors}
+
+    except Exception as e:
+        logger.exception("Unexpected error creating patients: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error occurred while creating patients.",
+        )
+
+    created = []
+    duplicates = []
+    for index, doc in enumerate(docs):
+        doc.pop("_id", None)
+        if index in failed:
+            duplicates.append(doc["patient_number"])
+        else:
+            created.append(doc)
+
+    with _patient_id_cache_lock:
+        for doc in created:
+            _patient_id_cache.pop(doc["patient_number"], None)
+
+    logger.info(
+        "Bulk registration: %d created, %d duplicate(s).",
+        len(created),
+        len(duplicates),
+    )
+    return ORJSONResponse(
+        content={"patients": created, "duplicates": duplicates},
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+def _stream_patients(
+    first: Optional[dict], cursor: Cursor
+) -> Iterator[bytes]:
+    """Encodes a patient cursor as a ``{"patients": [...]}`` JSON body.
+
+    Documents are serialized one at a time as the cursor yields them, so
+    the full result set is never held in memory.
+
+    Args:
+        first (Optional[dict]): The first document, already read from the
+            cursor, or None if the page is empty.
+        cursor (Cursor): The cursor holding the remaining documents.
+
+    Yields:
+        bytes: Consecutive chunks of the JSON body.
+    """
+    try:
+        if first is None:
+            yield b'{"patients":[]}'
+            return
+        yield b'{"patients":[' + orjson.dumps(first)
+        for patient in cursor:
+            yield b"," + orjson.dumps(patient)
+        yield b"]}"
+    finally:
+        cursor.close()
+
+
+def get_all_patients(skip: int = 0, limit: int = 100) -> StreamingResponse:
+    """Retrieves a page of patient profiles ordered by patient number.
+
+    The page is streamed to the client as documents arrive from MongoDB.
+
+    Args:
+        skip (int): Number of patients to skip. Defaults to 0.
+        limit (int): Maximum number of patients to return. Defaults to 100.
+
+    Returns:
+        StreamingResponse: A JSON response containing the list of patients,
+        which is empty when the page lies past the end of the collection.
 
     Raises:
         HTTPException: 500 if an error occurs while retrieving patients.
@@ -225,19 +346,22 @@ def get_all_patients() -> JSONResponse:
     try:
         patients = get_patient_collection()
 
-        patient_cursor = patients.find({}, {"_id": 0})
-        patient_list = list(patient_cursor)
+        patient_cursor = (
+            patients.find({}, projection={"_id": 0})
+            .sort("patient_number", 1)
+            .skip(skip)
+            .limit(limit)
+            .batch_size(500)
+        )
+        first = next(patient_cursor, None)
 
-        if not patient_list:
-            logger.info("No patients found in the database.")
-            return JSONResponse(
-                content={"message": "No patients found."},
-                status_code=status.HTTP_404_NOT_FOUND,
-            )
+        if first is None:
+            logger.info("No patients found at skip=%d.", skip)
 
-        return JSONResponse(
-            content={"patients": jsonable_encoder(patient_list)},
+        return StreamingResponse(
+            _stream_patients(first, patient_cursor),
             status_code=status.HTTP_200_OK,
+            media_type="application/json",
         )
 
     except HTTPException as http_err:
@@ -251,14 +375,14 @@ def get_all_patients() -> JSONResponse:
         )
 
 
-def get_patient_by_patient_number(patient_number: int) -> JSONResponse:
+def get_patient_by_patient_number(patient_number: int) -> ORJSONResponse:
     """Retrieves a patient by their patient number.
 
     Args:
         patient_number (int): The unique patient number.
 
     Returns:
-        JSONResponse: A JSON response containing the patient object.
+        ORJSONResponse: A JSON response containing the patient object.
 
     Raises:
         HTTPException: 400 if the patient_number is invalid.
@@ -266,7 +390,7 @@ def get_patient_by_patient_number(patient_number: int) -> JSONResponse:
         HTTPException: 500 if an error occurs during retrieval.
     """
     try:
-        logger.info("Fetching patient with patient_number: %s", patient_number)
+        logger.debug("Fetching patient with patient_number: %s", patient_number)
 
         # Validate patient_number
         if not isinstance(patient_number, int) or patient_number <= 0:
@@ -297,13 +421,13 @@ def get_patient_by_patient_number(patient_number: int) -> JSONResponse:
                 detail="Patient not found.",
             )
 
-        logger.info(
+        logger.debug(
             "Patient found: %s (patient_number: %s)",
             patient["name"],
             patient_number,
         )
-        return JSONResponse(
-            content={"status": "success", "patient": jsonable_encoder(patient)},
+        return ORJSONResponse(
+            content={"status": "success", "patient": patient},
             status_code=status.HTTP_200_OK,
         )
 
@@ -326,21 +450,101 @@ def get_patient_by_patient_number(patient_number: int) -> JSONResponse:
         )
 
 
-def get_patient_id(patient_number: int) -> int:
+def get_patients_by_numbers(patient_numbers: List[int]) -> List[dict]:
+    """Retrieves several patients in a single query.
+
+    Args:
+        patient_numbers (List[int]): The patient numbers to look up.
+
+    Returns:
+        List[dict]: The matching patient documents. Unknown numbers are
+            simply absent from the result.
+
+    Raises:
+        HTTPException: 500 if an error occurs during retrieval.
+    """
+    unique_numbers = list(set(patient_numbers))
+    if not unique_numbers:
+        return []
+
+    try:
+        patients = get_patient_collection()
+        cursor = patients.find(
+            {"patient_number": {"$in": unique_numbers}}, {"_id": 0}
+        ).batch_size(len(unique_numbers))
+        patient_list = list(cursor)
+
+        logger.debug(
+            "Retrieved %d of %d requested patient(s).",
+            len(patient_list),
+            len(unique_numbers),
+        )
+        return patient_list
+
+    except Exception as e:
+        logger.exception("Unexpected error retrieving patients: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unexpected error retrieving patients.",
+        )
+
+
+def patient_exists(patient_number: int) -> bool:
+    """Checks whether a patient with the given number is registered.
+
+    The projection only includes the indexed field, so the query is
+    answered from the patient_number index without fetching the document.
+
+    Args:
+        patient_number (int): The unique patient number.
+
+    Returns:
+        bool: True if the patient exists, False otherwise.
+
+    Raises:
+        HTTPException: 500 if an error occurs during the lookup.
+    """
+    try:
+        patients = get_patient_collection()
+        return (
+            patients.find_one(
+                {"patient_number": patient_number},
+                {"_id": 0, "patient_number": 1},
+            )
+            is not None
+        )
+
+    except Exception as e:
+        logger.exception("Error checking patient existence: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error checking patient existence.",
+        )
+
+
+@request_cached
+def get_patient_id(patient_number: int) -> uuid.UUID:
     """Retrieves the patient_id using the patient_number.
 
+    Results are served from an in-process TTL cache when available.
+
     Args:
         patient_number (int): The unique patient number.
 
     Returns:
-        str: The patient_id if found.
+        uuid.UUID: The patient_id if found.
 
     Raises:
         HTTPException: 404 if the patient is not found.
         HTTPException: 500 if an error occurs during retrieval.
     """
+    with _patient_id_cache_lock:
+        patient_id = _patient_id_cache.get(patient_number)
+    if patient_id is not None:
+        return patient_id
+
     try:
-        logger.info(
+        logger.debug(
             "Fetching patient_id for patient_number: %s", patient_number
         )
         patients = get_patient_collection()
@@ -357,11 +561,13 @@ def get_patient_id(patient_number: int) -> int:
                 detail="Patient not found.",
             )
 
-        logger.info(
+        logger.debug(
             "Patient ID found: %s for patient_number %s",
             patient["patient_id"],
             patient_number,
         )
+        with _patient_id_cache_lock:
+            _patient_id_cache[patient_number] = patient["patient_id"]
         return patient["patient_id"]
 
     except Exception as e:
@@ -7,12 +7,13 @@ from app.models.case import create_case
 from app.models.case import get_case_by_id
 from app.models.case import get_cases_by_doctor
 from app.models.case import get_cases_by_patient
+from app.models.case import MSGPACK_MEDIA_TYPE
 from app.models.doctor import get_current_doctor
-from app.schema.case import Case
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import File
 from fastapi import Form
+from fastapi import Header
 from fastapi import status
 from fastapi import UploadFile
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -26,7 +27,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post(
-    "/new_case", response_model=Case, status_code=status.HTTP_201_CREATED
+    "/new_case", response_model=None, status_code=status.HTTP_201_CREATED
 )
 async def create_new_case(
     patient_number: int = Form(
@@ -52,7 +53,7 @@ async def create_new_case(
         current_doctor (dict): The authenticated doctor's details who is creating the case.
 
     Returns:
-        JSONResponse: A JSON response containing the details of the newly created diagnosis case.
+        ORJSONResponse: A JSON response containing the details of the newly created diagnosis case.
 
     Raises:
         HTTPException: 400 if input data is invalid or missing.
@@ -64,21 +65,28 @@ async def create_new_case(
 
 @router.get("/cases/{case_id}", status_code=status.HTTP_200_OK)
 def get_case(case_id: str,
+             accept: Optional[str] = Header(None),
              credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
     ):
     """Fetches a specific case by its unique ID.
 
+    Clients sending ``Accept: application/msgpack`` receive the case encoded
+    as MessagePack; everyone else gets JSON.
+
     Args:
         case_id (str): The unique identifier of the case.
+        accept (Optional[str]): The request's Accept header.
 
     Returns:
-        JSONResponse: The requested case details.
+        Response: The requested case details.
 
     Raises:
         HTTPException: 404 if the case is not found.
         HTTPException: 500 if an internal server error occurs.
     """
-    return get_case_by_id(case_id)
+    return get_case_by_id(
+        case_id, as_msgpack=bool(accept and MSGPACK_MEDIA_TYPE in accept)
+    )
 
 
 @router.get("/get_cases", status_code=status.HTTP_200_OK)
@@ -91,7 +99,7 @@ def get_doctor_cases(current_doctor: dict = Depends(get_current_doctor),
         current_doctor (dict): Authenticated doctor.
 
     Returns:
-        JSONResponse: List of cases assigned to the doctor.
+        ORJSONResponse: List of cases assigned to the doctor.
 
     Raises:
         HTTPException: 500 if an internal server error occurs.
@@ -111,7 +119,7 @@ def get_patient_cases(
         current_doctor (dict): Authenticated doctor.
 
     Returns:
-        JSONResponse: List of cases associated with the patient.
+        ORJSONResponse: List of cases associated with the patient.
 
     Raises:
         HTTPException: 404 if no cases are found.
@@ -1,18 +1,26 @@
 """User management routes with authentication and proper HTTP responses."""
 
 import logging
+from typing import List
 
 from app.models.doctor import create_doctor
 from app.models.doctor import get_all_doctors
 from app.models.doctor import get_current_doctor
 from app.models.patient import create_patient
+from app.models.patient import create_patients_bulk
+from app.models.patient import get_all_patients
 from app.models.patient import get_patient_by_patient_number
+from app.models.patient import get_patients_by_numbers
+from app.models.patient import patient_exists
 from app.schema.authentication import LoginRequest
 from app.schema.doctor import DoctorCreate
 from app.schema.patient import PatientCreate
 from app.utils.authentication import authenticate_doctor
 from fastapi import APIRouter
+from fastapi import Body
 from fastapi import Depends
+from fastapi import Query
+from fastapi import Response
 from fastapi import status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
@@ -79,6 +87,34 @@ def register_patient(
     return create_patient(patient_in, current_doctor)
 
 
+# -------- Bulk Patient Registration (By Doctor) --------
+
+
+@router.post("/register-patients-bulk", status_code=status.HTTP_201_CREATED)
+def register_patients_bulk(
+    patients_in: List[PatientCreate] = Body(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Patients to register (at most 500).",
+    ),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    current_doctor: dict = Depends(get_current_doctor),
+):
+    """
+    Register several patients in one request.
+
+    Args:
+        patients_in (List[PatientCreate]): The validated patient registration data.
+        credentials (HTTPAuthorizationCredentials): Bearer token for authentication.
+        current_doctor (dict): The current doctor's details.
+
+    Returns:
+        JSONResponse: The created patients and any duplicate patient numbers.
+    """
+    return create_patients_bulk(patients_in, current_doctor)
+
+
 # -------- Get All Doctors (Admin Only) --------
 
 
@@ -99,6 +135,80 @@ def get_doctors(
     return get_all_doctors()
 
 
+# -------- Get All Patients (Paginated) --------
+
+
+@router.get("/patients", status_code=status.HTTP_200_OK)
+def get_patients(
+    skip: int = Query(0, ge=0, description="Number of patients to skip."),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of patients to return."
+    ),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+):
+    """
+    API Endpoint to get a page of patients.
+
+    Args:
+        skip (int): Number of patients to skip.
+        limit (int): Maximum number of patients to return.
+        credentials (HTTPAuthorizationCredentials): Bearer token for authentication.
+
+    Returns:
+        JSONResponse: The requested page of patients.
+    """
+    return get_all_patients(skip, limit)
+
+
+# -------- Get Patients by Patient Numbers (Batch) --------
+
+
+@router.post("/patients/batch", status_code=status.HTTP_200_OK)
+def get_patients_batch(
+    patient_numbers: List[int] = Body(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Patient numbers to look up (at most 200).",
+    ),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+):
+    """
+    API Endpoint to get several patients in one request.
+
+    Args:
+        patient_numbers (List[int]): The patient numbers to look up.
+        credentials (HTTPAuthorizationCredentials): Bearer token for authentication.
+
+    Returns:
+        dict: The matching patients under the "patients" key.
+    """
+    return {"patients": get_patients_by_numbers(patient_numbers)}
+
+
+# -------- Check a Patient Exists by Patient Number --------
+
+
+@router.head("/patients/{patient_number}", status_code=status.HTTP_200_OK)
+def head_patient(
+    patient_number: int,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+):
+    """
+    API Endpoint to check whether a patient exists without returning it.
+
+    Args:
+        patient_number (int): The unique identifier of the patient.
+        credentials (HTTPAuthorizationCredentials): Bearer token for authentication.
+
+    Returns:
+        Response: An empty 200 response if the patient exists, 404 otherwise.
+    """
+    if patient_exists(patient_number):
+        return Response(status_code=status.HTTP_200_OK)
+    return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+
 # -------- Get a Patient by Patient Number --------
 
 
@@ -0,0 +1,15 @@
+"""Shared default factories for the Pydantic schemas."""
+
+from datetime import datetime
+from datetime import timezone
+import uuid
+
+
+def utc_now() -> datetime:
+    """Returns the current time in UTC (default for creation timestamps)."""
+    return datetime.now(timezone.utc)
+
+
+def new_id() -> str:
+    """Returns a new random identifier in the stored string form."""
+    return str(uuid.uuid4())
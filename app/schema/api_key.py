@@ -4,6 +4,7 @@ from datetime import datetime
 import uuid
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 
@@ -18,6 +19,8 @@ class UserAPIKey(BaseModel):
         usage (int): Usage count for the API key.
     """
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     api_key_id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
         description="Unique identifier for the API key.",
@@ -41,6 +44,10 @@ class APIKey(BaseModel):
         expired_date (datetime): Expiration date of the API key (UTC).
     """
 
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", defer_build=True
+    )
+
     api_key: str = Field(..., description="The actual API key.")
     expired_date: datetime = Field(
         ..., description="Expiration date of the API key (UTC)."
@@ -1,21 +1,36 @@
 """Pydantic schemas for authentication and login requests."""
 
 from pydantic import BaseModel
-from pydantic import EmailStr
+from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import field_validator
+
+# Basic address shape check; compiled once by pydantic-core's regex engine
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
 
 
 class LoginRequest(BaseModel):
     """Schema for login request (only doctors can log in).
 
     Attributes:
-        email (EmailStr): Email address for login (validated format).
+        email (str): Email address for login (validated format, lower-cased).
         password (str): Password for login.
     """
 
-    email: EmailStr = Field(..., description="Email address for login.")
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", defer_build=True
+    )
+
+    email: str = Field(
+        ..., pattern=EMAIL_PATTERN, description="Email address for login."
+    )
     password: str = Field(..., description="Password for login.")
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def _normalize_email(cls, value: str) -> str:
+        return value.lower()
+
 
 class TokenResponse(BaseModel):
     """Schema for JWT token response.
@@ -25,6 +40,8 @@ class TokenResponse(BaseModel):
         token_type (str): Type of token issued, defaults to 'bearer'.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str = Field(..., description="JWT access token.")
     token_type: str = Field(
         default="bearer",
@@ -1,50 +1,54 @@
 """Pydantic schemas for case validation with image support."""
 
 from datetime import datetime
-from datetime import timezone
-from typing import List, Optional
+from typing import Optional, Tuple
 import uuid
 
+from app.schema import new_id
+from app.schema import utc_now
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
+from typing_extensions import TypedDict
 
 
-class DiagnosisResult(BaseModel):
+class DiagnosisResult(TypedDict, total=False):
     """Schema representing the diagnosis result with probabilities for each condition.
 
+    A TypedDict rather than a model, so it is validated inline as part of
+    the parent case schema without constructing a separate object.
+
     Attributes:
         malignant (Optional[float]): Probability of the condition being malignant.
         benign (Optional[float]): Probability of the condition being benign.
     """
 
-    malignant: Optional[float] = Field(
-        None, description="Probability of malignancy."
-    )
-    benign: Optional[float] = Field(
-        None, description="Probability of benign condition."
-    )
+    malignant: Optional[float]
+    benign: Optional[float]
 
 
 class CaseBase(BaseModel):
     """Base schema for a case.
 
     Attributes:
-        doctor_id (uuid.UUID): Unique identifier for the doctor handling the case.
+        doctor_id (str): Unique identifier for the doctor handling the case.
         patient_id (uuid.UUID): Unique identifier for the patient.
         diagnosis (Optional[DiagnosisResult]): The diagnosis result with probabilities.
-        notes (Optional[str]): Notes related to the case.
+        notes (Optional[Tuple[str, ...]]): Notes related to the case.
         created_at (datetime): Timestamp of case creation (UTC).
     """
 
-    doctor_id: uuid.UUID
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    doctor_id: str
     patient_id: uuid.UUID
     patient_number: Optional[int] = None
     diagnosis: Optional[DiagnosisResult] = None
-    notes: Optional[List[str]] = Field(
-        default_factory=list, description="Notes related to the case."
+    notes: Optional[Tuple[str, ...]] = Field(
+        default=(), description="Notes related to the case."
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="Timestamp of case creation (UTC).",
     )
 
@@ -63,12 +67,12 @@ class Case(CaseBase):
     """Schema for a case stored in the database.
 
     Attributes:
-        case_id (uuid.UUID): Unique identifier for the case.
+        case_id (str): Unique identifier for the case.
         image_id (str): URL to access the uploaded image.
     """
 
-    case_id: uuid.UUID = Field(
-        default_factory=uuid.uuid4,
+    case_id: str = Field(
+        default_factory=new_id,
         description="Unique identifier for the case.",
     )
     image_id: Optional[str] = Field(
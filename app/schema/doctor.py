@@ -1,26 +1,41 @@
 """Pydantic schemas for doctor management."""
 
 from datetime import datetime
-from datetime import timezone
-import uuid
 
+from app.schema import new_id
+from app.schema import utc_now
 from app.schema.api_key import APIKey
+from app.schema.authentication import EMAIL_PATTERN
 from pydantic import BaseModel
-from pydantic import EmailStr
+from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import field_validator
 
 
 class DoctorBase(BaseModel):
     """Base schema for a doctor.
 
     Attributes:
-        email (EmailStr): Email address of the doctor.
+        email (str): Email address of the doctor (lower-cased).
         name (str): Full name of the doctor.
     """
 
-    email: EmailStr = Field(..., description="Email address of the doctor.")
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", defer_build=True
+    )
+
+    email: str = Field(
+        ...,
+        pattern=EMAIL_PATTERN,
+        description="Email address of the doctor.",
+    )
     name: str = Field(..., description="Full name of the doctor.")
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def _normalize_email(cls, value: str) -> str:
+        return value.lower()
+
 
 class DoctorCreate(DoctorBase):
     """Schema for creating a new doctor account.
@@ -36,16 +51,16 @@ class DoctorDB(DoctorBase):
     """Schema for a doctor stored in the database.
 
     Attributes:
-        doctor_id (uuid.UUID): Unique identifier for the doctor.
+        doctor_id (str): Unique identifier for the doctor.
         created_at (datetime): Timestamp of doctor account creation (UTC).
     """
 
-    doctor_id: uuid.UUID = Field(
-        default_factory=uuid.uuid4,
+    doctor_id: str = Field(
+        default_factory=new_id,
         description="Unique identifier for the doctor.",
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="Timestamp of doctor account creation (UTC).",
     )
 
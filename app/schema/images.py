@@ -1,24 +1,28 @@
-"""Pydantic schema for handling image uploads."""
+"""Schema for handling image uploads."""
 
-from pydantic import BaseModel
-from pydantic import Field
+import msgspec
 
 
-class UploadImage(BaseModel):
+class UploadImage(msgspec.Struct, frozen=True, gc=False):
     """Schema for uploading an image.
 
+    This envelope is only built internally from an already-read upload, so
+    it is a msgspec Struct rather than a Pydantic model: construction skips
+    the validator chain and never copies the image bytes.
+
     Attributes:
         image_bytes (bytes): The binary data of the image (must not be empty).
         image_name (str): The name of the image file (must not be empty).
+
+    Raises:
+        ValueError: If the image data or name is empty.
     """
 
-    image_bytes: bytes = Field(
-        ...,
-        min_length=1,
-        description="Binary data of the image (cannot be empty).",
-    )
-    image_name: str = Field(
-        ...,
-        min_length=1,
-        description="The name of the image file (cannot be empty).",
-    )
+    image_bytes: bytes
+    image_name: str
+
+    def __post_init__(self) -> None:
+        if not self.image_bytes:
+            raise ValueError("Image data cannot be empty.")
+        if not self.image_name:
+            raise ValueError("Image name cannot be empty.")
@@ -2,17 +2,23 @@
 
 from datetime import date
 from datetime import datetime
-from datetime import timezone
 from typing import List, Optional
 import uuid
 
+from app.schema import utc_now
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import field_validator
 
 
 class PatientCreate(BaseModel):
     """Schema for creating a new patient.
 
+    Free-text fields are normalized during validation: ``name`` and the
+    optional descriptive fields are title-cased (empty values become None)
+    and ``gender`` is lower-cased.
+
     Attributes:
         patient_number (int): Patient number provided during registration (must be positive).
         name (str): Full name of the patient.
@@ -24,6 +30,10 @@ class PatientCreate(BaseModel):
         notes (Optional[List[str]]): Notes related to the patient (defaults to an empty list).
     """
 
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", defer_build=True
+    )
+
     patient_number: int = Field(
         ...,
         gt=0,
@@ -45,6 +55,21 @@ class PatientCreate(BaseModel):
         default_factory=list, description="Notes related to the patient."
     )
 
+    @field_validator("name", mode="after")
+    @classmethod
+    def _normalize_name(cls, value: str) -> str:
+        return value.strip().title()
+
+    @field_validator("country", "occupation", "ethnicity", mode="after")
+    @classmethod
+    def _normalize_optional_text(cls, value: Optional[str]) -> Optional[str]:
+        return value.strip().title() if value else None
+
+    @field_validator("gender", mode="after")
+    @classmethod
+    def _normalize_gender(cls, value: str) -> str:
+        return value.strip().lower()
+
 
 class Patient(PatientCreate):
     """Schema representing a patient in the system.
@@ -59,6 +84,6 @@ class Patient(PatientCreate):
         description="Unique identifier for the patient.",
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="Timestamp of patient record creation (UTC).",
     )
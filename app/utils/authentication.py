@@ -1,7 +1,13 @@
+import base64
+import binascii
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+import hashlib
+import hmac
 import logging
+import secrets
+import time
 
 from app.config import config
 from app.models import doctor  # Import the entire module to avoid circular dependency
@@ -10,6 +16,7 @@ import bcrypt
 from fastapi import HTTPException
 from fastapi import status
 import jwt
+import orjson
 
 # from dotenv import load_dotenv
 
@@ -17,57 +24,144 @@ import jwt
 # ✅ Logging setup
 logger = logging.getLogger(__name__)
 
+# JWT settings are fixed for the life of the process
+_SECRET_KEY = config.get_secret_key()
+_ALGORITHM = config.get_algorithm()
+_ALGORITHMS = [_ALGORITHM]
+_TOKEN_EXPIRY = timedelta(minutes=config.get_access_token_expiry())
+_JWT = jwt.PyJWT()
+
+# HS256 tokens are signed and verified directly with hmac/hashlib
+_SECRET_BYTES = _SECRET_KEY.encode("utf-8")
+
+# Throwaway hash checked when a login email is unknown, so unknown and known
+# emails cost the same bcrypt work and timing does not reveal which exist.
+_DUMMY_HASH = bcrypt.hashpw(
+    secrets.token_bytes(16),
+    bcrypt.gensalt(rounds=config.get_bcrypt_salt_rounds()),
+)
+
 # ----------------- Password Utilities ----------------- #
 
 
 def hash_password(password: str) -> str:
-    """Hashes a password using bcrypt."""
-    try:
-        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-        return hashed.decode("utf-8")
-    except Exception as e:
-        logger.error("Error in hash_password: %s", str(e))
-        raise
+    """Hashes a password using bcrypt with the configured number of rounds."""
+    salt = bcrypt.gensalt(rounds=config.get_bcrypt_salt_rounds())
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies if the provided password matches the hashed password."""
-    if not hashed_password:
-        logger.error(
-            "verify_password: Provided hashed_password is None or empty."
-        )
+    if not isinstance(hashed_password, str) or not hashed_password.startswith(
+        "$2"
+    ):
+        logger.error("verify_password: Stored hash is missing or not bcrypt.")
         return False
     try:
         return bcrypt.checkpw(
             plain_password.encode("utf-8"), hashed_password.encode("utf-8")
         )
-    except Exception as e:
-        logger.error("Error in verify_password: %s", str(e))
+    except ValueError:
+        logger.error("verify_password: Stored bcrypt hash is malformed.")
         return False
 
 
 # ----------------- JWT Token Handling ----------------- #
 
 
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encodes data without padding, as JWT requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decodes unpadded base64url data."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+_HS256_HEADER = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def _hs256_signature(signing_input: bytes) -> bytes:
+    """Computes the encoded HMAC-SHA256 signature of a token."""
+    return _b64url_encode(
+        hmac.new(_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+    )
+
+
+def _encode_hs256(payload: dict) -> str:
+    """Encodes and signs an HS256 JWT.
+
+    Args:
+        payload (dict): The claims to encode; ``exp`` must be a timestamp.
+
+    Returns:
+        str: The compact JWT.
+    """
+    body = _b64url_encode(orjson.dumps(payload))
+    signing_input = _HS256_HEADER + b"." + body
+    return (signing_input + b"." + _hs256_signature(signing_input)).decode(
+        "ascii"
+    )
+
+
+def _decode_hs256(token: str) -> dict:
+    """Verifies an HS256 JWT and returns its claims.
+
+    Args:
+        token (str): The compact JWT.
+
+    Returns:
+        dict: The decoded claims.
+
+    Raises:
+        jwt.ExpiredSignatureError: If the ``exp`` claim has passed.
+        jwt.InvalidTokenError: If the token is malformed, uses another
+            algorithm or has an invalid signature.
+    """
+    try:
+        header_b64, body_b64, signature = token.encode("ascii").split(b".")
+        header = orjson.loads(_b64url_decode(header_b64))
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            raise jwt.InvalidAlgorithmError("The specified alg is not allowed")
+        expected = _hs256_signature(header_b64 + b"." + body_b64)
+        if not hmac.compare_digest(expected, signature):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+        payload = orjson.loads(_b64url_decode(body_b64))
+    except (ValueError, UnicodeError, binascii.Error):
+        raise jwt.DecodeError("Invalid token")
+
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload")
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, int) or isinstance(exp, bool):
+            raise jwt.DecodeError(
+                "Expiration Time claim (exp) must be an integer."
+            )
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+
 def create_access_token(data: dict) -> str:
     """Generates a JWT access token."""
-    to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=config.get_access_token_expiry()
-    )
-    to_encode.update({"exp": expire})
+    expire = datetime.now(timezone.utc) + _TOKEN_EXPIRY
+    if _ALGORITHM == "HS256":
+        return _encode_hs256({**data, "exp": int(expire.timestamp())})
 
-    return jwt.encode(
-        to_encode, config.get_secret_key(), algorithm=config.get_algorithm()
+    return _JWT.encode(
+        {**data, "exp": expire}, _SECRET_KEY, algorithm=_ALGORITHM
     )
 
 
 def verify_token(token: str) -> dict:
     """Verifies a JWT token and returns the decoded payload."""
     try:
-        payload = jwt.decode(
-            token, config.get_secret_key(), algorithms=[config.get_algorithm()]
-        )
+        if _ALGORITHM == "HS256":
+            return _decode_hs256(token)
+        payload = _JWT.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
         return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(
@@ -95,22 +189,26 @@ def authenticate_doctor(login_data: LoginRequest) -> dict:
         HTTPException: If authentication fails due to missing fields, invalid credentials,
                       or an unexpected error occurs.
     """
+    log_info = logger.isEnabledFor(logging.INFO)
     try:
         if not login_data.email or not login_data.password:
             logger.error(
-                "Login data is missing required fields: email or password. Received: %s",
-                login_data.model_dump(),
+                "Login data is missing required fields: email or password. Received email: %s",
+                login_data.email,
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email and password are required.",
             )
 
-        logger.info(
-            "Attempting to authenticate doctor with email: %s", login_data.email
-        )
-        doctor_data = doctor.get_doctor_by_email(login_data.email.lower())
+        if log_info:
+            logger.info(
+                "Attempting to authenticate doctor with email: %s",
+                login_data.email,
+            )
+        doctor_data = doctor.get_doctor_credentials(login_data.email)
         if not doctor_data:
+            bcrypt.checkpw(login_data.password.encode("utf-8"), _DUMMY_HASH)
             logger.warning(
                 "Authentication failed: No doctor found with email: %s",
                 login_data.email,
@@ -135,10 +233,11 @@ def authenticate_doctor(login_data: LoginRequest) -> dict:
         access_token = create_access_token(
             data={"id": doctor_data["doctor_id"], "email": doctor_data["email"]}
         )
-        logger.info(
-            "JWT access token generated successfully for email: %s",
-            login_data.email,
-        )
+        if log_info:
+            logger.info(
+                "JWT access token generated successfully for email: %s",
+                login_data.email,
+            )
         return {"access_token": access_token}
 
     except HTTPException as http_err:
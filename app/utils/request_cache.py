@@ -0,0 +1,59 @@
+"""Request-scoped memoization for database lookups."""
+
+from contextvars import ContextVar
+import functools
+from typing import Callable, Optional
+
+# Holds the lookup cache for the request being served, or None outside one.
+_request_cache: ContextVar[Optional[dict]] = ContextVar(
+    "request_cache", default=None
+)
+
+
+def start_request_cache():
+    """Activates an empty lookup cache for the current request.
+
+    Returns:
+        Token: The token needed to restore the previous state.
+    """
+    return _request_cache.set({})
+
+
+def end_request_cache(token) -> None:
+    """Discards the current request's lookup cache.
+
+    Args:
+        token (Token): The token returned by start_request_cache.
+    """
+    _request_cache.reset(token)
+
+
+def request_cached(func: Callable) -> Callable:
+    """Memoizes a lookup function for the lifetime of a single request.
+
+    Calls with the same hashable arguments return the first result without
+    another database roundtrip. Exceptions are not cached, and calls made
+    outside a request always run the wrapped function.
+
+    Args:
+        func (Callable): The lookup function to wrap.
+
+    Returns:
+        Callable: The wrapped function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _request_cache.get()
+        if cache is None:
+            return func(*args, **kwargs)
+
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        if key in cache:
+            return cache[key]
+
+        result = func(*args, **kwargs)
+        cache[key] = result
+        return result
+
+    return wrapper
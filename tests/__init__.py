@@ -0,0 +1,15 @@
+"""Test package setup.
+
+Under pytest-xdist each worker gets its own database, so collection cleanup in
+one worker never affects another. This runs before conftest imports the app,
+which reads DB_NAME once when the database handler is created.
+"""
+
+import os
+
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if _XDIST_WORKER:
+    from decouple import config
+
+    _base_db_name = config("DB_NAME", default="TEST_SKIN_DIAGNOSIS_DB")
+    os.environ["DB_NAME"] = f"{_base_db_name}_{_XDIST_WORKER}"
@@ -1,11 +1,33 @@
+from datetime import datetime
+from datetime import timezone
+import hashlib
+import itertools
 import logging
+import time
+import uuid
 
 from app.config import config  # Import config module for environment variables
 from app.db.MongoDB import MongoDBHandler
 from app.main import app
+from app.models.api_key import get_api_key_collection
+from app.models.case import get_case_collection
+from app.models.doctor import create_doctor
+from app.models.doctor import get_doctor_by_email
+from app.models.doctor import get_doctor_collection
+from app.models.patient import create_patient
+from app.models.patient import get_patient_by_patient_number
+from app.models.patient import get_patient_collection
+from app.schema.doctor import DoctorCreate
+from app.schema.patient import PatientCreate
+from app.utils import authentication
+from fastapi import Response
 from fastapi.testclient import TestClient
+from httpx import ASGITransport
+from httpx import AsyncClient
+import orjson
 from pymongo import MongoClient
 import pytest
+import pytest_asyncio
 
 # ------------------- FORCE LOAD `.env.test` ------------------- #
 IS_TESTING = config.is_testing()
@@ -21,6 +43,22 @@ MONGO_URI = (
     f"{config.get_mongo_cluster()}?retryWrites=true&w=majority"
 )
 
+# ------------------- UNIQUE TEST VALUES ------------------- #
+# Seeded from the clock so values differ between runs. Each xdist worker has
+# its own database, so uniqueness within one process is all that is needed.
+_unique_counter = itertools.count(int(time.time()))
+
+
+def _unique_email():
+    """Returns a doctor email no earlier call has produced."""
+    return f"testdoctor_{next(_unique_counter):x}@example.com"
+
+
+def _unique_patient_number():
+    """Returns an 8-digit patient number no earlier call has produced."""
+    return 10_000_000 + next(_unique_counter) % 90_000_000
+
+
 # ------------------- FIXTURES ------------------- #
 
 
@@ -37,6 +75,50 @@ def mongo_test_client():
     client.close()
 
 
+# The real implementations, captured before fast_auth replaces them.
+_REAL_HASH_PASSWORD = authentication.hash_password
+_REAL_VERIFY_PASSWORD = authentication.verify_password
+
+
+def _fast_hash(password):
+    return hashlib.sha1(password.encode("utf-8")).hexdigest()
+
+
+def _fast_verify(plain_password, hashed_password):
+    return _fast_hash(plain_password) == hashed_password
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_auth():
+    """Swaps bcrypt for a SHA-1 stand-in for the whole session.
+
+    Installed before any other session fixture, so every doctor registered
+    through the app is hashed and verified by the same stand-in.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(authentication, "hash_password", _fast_hash)
+        mp.setattr(authentication, "verify_password", _fast_verify)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def real_bcrypt(request, monkeypatch):
+    """Restores real bcrypt for tests marked ``real_bcrypt``."""
+    if request.node.get_closest_marker("real_bcrypt"):
+        monkeypatch.setattr(
+            authentication, "hash_password", _REAL_HASH_PASSWORD
+        )
+        monkeypatch.setattr(
+            authentication, "verify_password", _REAL_VERIFY_PASSWORD
+        )
+
+
+@pytest.fixture(scope="session")
+def hashed_secure_password():
+    """Provides the real bcrypt hash of "securepassword", computed once."""
+    return _REAL_HASH_PASSWORD("securepassword")
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_mongo():
     """Ensures the global MongoDBHandler connects before tests and disconnects after."""
@@ -47,6 +129,15 @@ def setup_mongo():
     db_handler.disconnect()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_collections(setup_mongo):
+    """Resolves every memoized collection handle once, before any test runs."""
+    get_api_key_collection()
+    get_case_collection()
+    get_doctor_collection()
+    get_patient_collection()
+
+
 @pytest.fixture(scope="session")
 def test_database(mongo_test_client):
     """Provides access to the test database and cleans up after tests."""
@@ -57,8 +148,161 @@ def test_database(mongo_test_client):
 
 
 @pytest.fixture(scope="session")
-def test_client():
-    """Provides a FastAPI TestClient with lifespan events."""
+def client():
+    """Provides a FastAPI TestClient with lifespan events, shared by the session."""
     # Using a context manager triggers the startup and shutdown events
     with TestClient(app) as client:
         yield client
+
+
+@pytest_asyncio.fixture
+async def aclient(client):
+    """Provides an async client so independent requests can run concurrently.
+
+    Depends on ``client`` so the app's lifespan startup has already run.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def cases_collection():
+    """Provides the cases collection handle, looked up once per session."""
+    return get_case_collection()
+
+
+@pytest.fixture(scope="session")
+def api_keys_collection():
+    """Provides the API keys collection handle, looked up once per session."""
+    return get_api_key_collection()
+
+
+@pytest.fixture
+def unique_patient_number():
+    """Provides a patient number not yet used in this session."""
+    return _unique_patient_number()
+
+
+@pytest.fixture(scope="session")
+def uuid_pool():
+    """Pre-generates the UUIDs handed out by ``fresh_uuid`` for the session."""
+    return [uuid.uuid4() for _ in range(128)]
+
+
+@pytest.fixture
+def fresh_uuid(uuid_pool):
+    """Provides a UUID no other test in the session has used."""
+    return uuid_pool.pop()
+
+
+# ------------------- REGISTRATION WORKFLOW ------------------- #
+
+
+@pytest.fixture(scope="session")
+def registered_doctor(client):
+    """Registers a doctor with a unique email once per session."""
+    doctor = {
+        "name": "Dr. Test",
+        "email": _unique_email(),
+        "password": "securepassword",
+    }
+    response = client.post("/users/register-doctor", json=doctor)
+    assert response.status_code in [
+        200,
+        201,
+    ], f"Unexpected response: {response.json()}"
+    return doctor
+
+
+@pytest.fixture(scope="session")
+def auth_token(client, registered_doctor):
+    """Logs the registered doctor in once and returns the access token."""
+    response = client.post(
+        "/users/login",
+        json={
+            "email": registered_doctor["email"],
+            "password": registered_doctor["password"],
+        },
+    )
+    assert (
+        response.status_code == 200
+    ), f"Unexpected response: {response.json()}"
+    return response.json().get("access_token")
+
+
+@pytest.fixture(scope="session")
+def registered_patient(client, auth_token):
+    """Registers a patient with a unique patient number once per session."""
+    patient = {
+        "patient_number": _unique_patient_number(),
+        "name": "Jane Doe",
+        "date_of_birth": "1993-05-15",
+        "gender": "Female",
+        "country": "USA",
+        "occupation": "Teacher",
+        "ethnicity": "Caucasian",
+        "notes": ["No known allergies"],
+    }
+    response = client.post(
+        "/users/register-patient",
+        json=patient,
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code in [
+        200,
+        201,
+    ], f"Unexpected response: {response.json()}"
+    return patient
+
+
+# ------------------- MODEL-LEVEL RECORDS ------------------- #
+
+
+def _unwrap(result):
+    """Returns a model function's result as data, parsing it if a Response."""
+    if isinstance(result, Response):
+        return orjson.loads(result.body)
+    return result
+
+
+@pytest.fixture(scope="session")
+def new_doctor():
+    """Creates a doctor through the model layer once per session.
+
+    Tests only read the returned record, so every module can share it.
+    """
+    email = _unique_email()
+    doctor_info = {
+        "name": "Dr. Test",
+        "email": email,
+        "password": "securepassword",
+    }
+    response = create_doctor(DoctorCreate(**doctor_info))
+    # Verify creation via status code
+    assert response.status_code == 201
+    doctor = _unwrap(get_doctor_by_email(email))
+    assert doctor is not None
+    return doctor
+
+
+@pytest.fixture(scope="session")
+def new_patient(new_doctor):
+    """Creates a patient for ``new_doctor`` once per session."""
+    patient_number = _unique_patient_number()
+    patient_info = {
+        "patient_number": patient_number,
+        "name": "John Doe",
+        "date_of_birth": datetime(1985, 8, 25, tzinfo=timezone.utc),
+        "gender": "Uk",  # Adjust as needed (e.g., "UK")
+        "occupation": "Engineer",
+        "ethnicity": "Hispanic",
+        "notes": ["Allergic to penicillin"],
+    }
+    response = create_patient(
+        PatientCreate(**patient_info), {"doctor_id": new_doctor["doctor_id"]}
+    )
+    assert response.status_code == 201
+    patient = _unwrap(get_patient_by_patient_number(patient_number))
+    assert patient is not None
+    return patient
@@ -82,10 +82,10 @@ def sample_patient(test_database):
 def sample_case(test_database, sample_doctor, sample_patient):
     """Fixture to insert a sample case associated with a patient and doctor."""
     case = CaseCreate(
-        doctor_id=uuid.UUID(sample_doctor["doctor_id"]),
+        doctor_id=sample_doctor["doctor_id"],
         patient_id=uuid.UUID(sample_patient["patient_id"]),
         diagnosis=DiagnosisResult(malignant=0.2, benign=0.8),
-        notes="Routine check-up",
+        notes=["Routine check-up"],
     )
     case_dict = case.dict()
     case_dict["case_id"] = str(uuid.uuid4())
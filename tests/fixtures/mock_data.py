@@ -1,46 +1,70 @@
-"""Mock data for testing the Skin Diagnosis System API."""
+"""Mock data for testing the Skin Diagnosis System API.
 
+The mocks are plain dicts holding the values the schemas would produce after
+validation and normalization, so building them runs no Pydantic validation.
+IDs and timestamps are fixed so every build of the mocks is identical.
+"""
+
+from datetime import date
 from datetime import datetime
 from datetime import timezone
+import functools
 import uuid
 
-from app.schema.case import CaseCreate
-from app.schema.case import DiagnosisResult
-from app.schema.doctor import DoctorCreate
-from app.schema.patient import PatientCreate
-
-# Mock doctor data
-MOCK_DOCTOR = DoctorCreate(
-    name="Dr. Jane Smith",
-    email="janesmith@example.com",
-    password="securepassword",
-).dict()
-MOCK_DOCTOR["doctor_id"] = str(uuid.uuid4())
-MOCK_DOCTOR["created_at"] = datetime.now(timezone.utc)
-
-# Mock patient data
-MOCK_PATIENT = PatientCreate(
-    patient_number=54321,
-    name="John Doe",
-    date_of_birth=datetime(1985, 8, 25, tzinfo=timezone.utc),
-    gender="Male",
-    country="UK",
-    occupation="Engineer",
-    ethnicity="Hispanic",
-    notes=["Allergic to penicillin"],
-).dict()
-MOCK_PATIENT["patient_id"] = str(uuid.uuid4())
-MOCK_PATIENT["created_at"] = datetime.now(timezone.utc)
-
-# Mock case data
-MOCK_CASE = CaseCreate(
-    doctor_id=uuid.UUID(MOCK_DOCTOR["doctor_id"]),
-    patient_id=uuid.UUID(MOCK_PATIENT["patient_id"]),
-    diagnosis=DiagnosisResult(malignant=0.1, benign=0.9),
-    notes="Follow-up required",
-).dict()
-MOCK_CASE["case_id"] = str(uuid.uuid4())
-MOCK_CASE["created_at"] = datetime.now(timezone.utc)
-
-# List of mock data
-MOCK_DATA = {"doctor": MOCK_DOCTOR, "patient": MOCK_PATIENT, "case": MOCK_CASE}
+# Fixed values in place of uuid4() and datetime.now() keep the mocks stable.
+MOCK_CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+MOCK_DOCTOR_ID = str(uuid.UUID(int=1))
+MOCK_PATIENT_ID = str(uuid.UUID(int=2))
+MOCK_CASE_ID = str(uuid.UUID(int=3))
+
+
+@functools.lru_cache(maxsize=1)
+def mock_doctor() -> dict:
+    """Returns mock doctor data."""
+    return {
+        "name": "Dr. Jane Smith",
+        "email": "janesmith@example.com",
+        "password": "securepassword",
+        "doctor_id": MOCK_DOCTOR_ID,
+        "created_at": MOCK_CREATED_AT,
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def mock_patient() -> dict:
+    """Returns mock patient data."""
+    return {
+        "patient_number": 54321,
+        "name": "John Doe",
+        "date_of_birth": date(1985, 8, 25),
+        "gender": "male",
+        "country": "Uk",
+        "occupation": "Engineer",
+        "ethnicity": "Hispanic",
+        "notes": ["Allergic to penicillin"],
+        "patient_id": MOCK_PATIENT_ID,
+        "created_at": MOCK_CREATED_AT,
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def mock_case() -> dict:
+    """Returns mock case data linked to the mock doctor and patient."""
+    return {
+        "doctor_id": MOCK_DOCTOR_ID,
+        "patient_id": uuid.UUID(MOCK_PATIENT_ID),
+        "patient_number": None,
+        "diagnosis": {"malignant": 0.1, "benign": 0.9},
+        "notes": ("Follow-up required",),
+        "case_id": MOCK_CASE_ID,
+        "created_at": MOCK_CREATED_AT,
+    }
+
+
+def mock_data() -> dict:
+    """Returns all mock data keyed by entity."""
+    return {
+        "doctor": mock_doctor(),
+        "patient": mock_patient(),
+        "case": mock_case(),
+    }
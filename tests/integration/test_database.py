@@ -1,27 +1,28 @@
 from app.config import config
+from app.config.db_init import db_handler as shared_db_handler
 from app.db.MongoDB import MongoDBHandler
 from pymongo.errors import ConnectionFailure
 import pytest
 
 
 @pytest.fixture(scope="module")
-def mongo_test_client():
-    """Fixture to provide a test MongoDB client."""
-    mongo_handler = MongoDBHandler()
-    mongo_handler.connect()
-    yield mongo_handler.client
-    mongo_handler.disconnect()
+def test_database():
+    """Fixture to create and clean up a test database.
 
-
-@pytest.fixture(scope="module")
-def test_database(mongo_test_client):
-    """Fixture to create and clean up a test database."""
-    test_db_name = config.get_db_name()
-    test_db = mongo_test_client[test_db_name]
+    Uses the application's client, connected once per session in conftest.
+    The configured database name is already unique per xdist worker, so a
+    fixed ``_dbtest`` suffix gives this module its own scratch database;
+    dropping it never touches the one the app and other modules are using.
+    """
+    test_db_name = f"{config.get_db_name()}_dbtest"
+    test_db = shared_db_handler.client[test_db_name]
+    # Create the unique email index once rather than per test.
+    test_db[config.get_doctors_collection()].create_index(
+        "email", unique=True
+    )
     yield test_db
-    # Instead of dropping the database, drop all collections.
-    for collection_name in test_db.list_collection_names():
-        test_db.drop_collection(collection_name)
+    # One dropDatabase command instead of a drop per collection.
+    shared_db_handler.client.drop_database(test_db_name)
 
 
 @pytest.mark.order(1)
@@ -56,8 +57,13 @@ def test_insert_and_retrieve_doctor(test_database):
         "email": "testdoctor@example.com",
         "password": "hashedpassword",
     }
-    insert_result = doctors_collection.insert_one(sample_doctor)
-    assert insert_result.inserted_id is not None
+    # One round trip however many doctors are seeded.
+    insert_result = doctors_collection.insert_many(
+        [sample_doctor], ordered=False
+    )
+    assert all(
+        inserted_id is not None for inserted_id in insert_result.inserted_ids
+    )
 
     retrieved_doctor = doctors_collection.find_one(
         {"email": "testdoctor@example.com"}
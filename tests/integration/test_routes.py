@@ -1,132 +1,87 @@
+import asyncio
 from io import BytesIO
-import random
-import uuid
 
-from app.main import app
-from fastapi.testclient import TestClient
 from PIL import Image
 import pytest
 
-client = TestClient(app)
-
-
-def generate_unique_email():
-    return f"testdoctor_{uuid.uuid4().hex[:8]}@example.com"
-
-
-def generate_unique_patient_number():
-    return random.randint(10000000, 99999999)
-
-
-@pytest.fixture(scope="session")
-def unique_doctor():
-    return {
-        "name": "Dr. Test",
-        "email": generate_unique_email(),
-        "password": "securepassword",
-    }
-
 
 @pytest.mark.order(1)
-def test_register_doctor(unique_doctor):
-    response = client.post("/users/register-doctor", json=unique_doctor)
-    assert response.status_code in [
-        200,
-        201,
-    ], f"Unexpected response: {response.json()}"
-
-
-@pytest.mark.order(2)
-def test_login_doctor(unique_doctor):
-    response = client.post(
-        "/users/login",
-        json={
-            "email": unique_doctor["email"],
-            "password": unique_doctor["password"],
-        },
-    )
+def test_register_doctor_duplicate_rejected(client, registered_doctor):
+    response = client.post("/users/register-doctor", json=registered_doctor)
     assert (
-        response.status_code == 200
+        response.status_code == 400
     ), f"Unexpected response: {response.json()}"
 
 
-@pytest.fixture(scope="function")
-def auth_token(unique_doctor):
-    auth_response = client.post(
-        "/users/login",
-        json={
-            "email": unique_doctor["email"],
-            "password": unique_doctor["password"],
-        },
-    )
-    return auth_response.json().get("access_token")
+@pytest.mark.order(2)
+def test_login_doctor(auth_token):
+    assert auth_token
 
 
 @pytest.fixture(scope="session")
-def unique_patient():
-    return {
-        "patient_number": generate_unique_patient_number(),
-        "name": "Jane Doe",
-        "date_of_birth": "1993-05-15",
-        "gender": "Female",
-        "country": "USA",
-        "occupation": "Teacher",
-        "ethnicity": "Caucasian",
-        "notes": ["No known allergies"],
-    }
+def valid_image_bytes():
+    # Ensure that tests/data/test_image.jpeg exists and is a valid JPEG.
+    with open("tests/data/test_image.jpeg", "rb") as f:
+        return f.read()
 
 
 @pytest.mark.order(3)
-def test_register_patient(auth_token, unique_patient):
+def test_register_patient_duplicate_rejected(
+    client, auth_token, registered_patient
+):
     response = client.post(
         "/users/register-patient",
-        json=unique_patient,
+        json=registered_patient,
         headers={"Authorization": f"Bearer {auth_token}"},
     )
-    assert response.status_code in [
-        200,
-        201,
-    ], f"Unexpected response: {response.json()}"
+    assert (
+        response.status_code == 400
+    ), f"Unexpected response: {response.json()}"
 
 
 @pytest.mark.order(4)
-def test_get_all_doctors(auth_token):
-    response = client.get(
-        "/users/doctors", headers={"Authorization": f"Bearer {auth_token}"}
+async def test_independent_reads(aclient, auth_token, registered_patient):
+    """Test the read-only listing and lookup routes, issued concurrently."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    doctors, patient, patients = await asyncio.gather(
+        aclient.get("/users/doctors", headers=headers),
+        aclient.get(
+            f"/users/patients/{registered_patient['patient_number']}",
+            headers=headers,
+        ),
+        aclient.get(
+            "/users/patients",
+            params={"skip": 0, "limit": 5},
+            headers=headers,
+        ),
     )
-    assert (
-        response.status_code == 200
-    ), f"Unexpected response: {response.json()}"
-    assert isinstance(response.json().get("doctors"), list)
 
+    assert doctors.status_code == 200, f"Unexpected response: {doctors.json()}"
+    assert isinstance(doctors.json().get("doctors"), list)
 
-@pytest.mark.order(5)
-def test_get_patient_by_number(auth_token, unique_patient):
-    response = client.get(
-        f"/users/patients/{unique_patient['patient_number']}",
-        headers={"Authorization": f"Bearer {auth_token}"},
-    )
-    assert (
-        response.status_code == 200
-    ), f"Unexpected response: {response.json()}"
-    patient_data = response.json().get("patient", {})
+    assert patient.status_code == 200, f"Unexpected response: {patient.json()}"
+    patient_data = patient.json().get("patient", {})
     assert (
         patient_data.get("name") == "Jane Doe"
     ), f"Unexpected patient data: {patient_data}"
 
+    assert (
+        patients.status_code == 200
+    ), f"Unexpected response: {patients.json()}"
+    listed = patients.json().get("patients")
+    assert isinstance(listed, list)
+    assert len(listed) <= 5
+
 
 @pytest.mark.order(6)
-def test_create_new_case(auth_token, unique_patient):
+def test_create_new_case(
+    client, auth_token, registered_patient, valid_image_bytes
+):
     """Test creating a new medical case using an actual image file."""
-    # Open the actual image file in binary mode.
-    # Ensure that tests/assets/test_image.jpg exists and is a valid JPEG.
-    with open("tests/data/test_image.jpeg", "rb") as f:
-        valid_image_bytes = f.read()
-
     response = client.post(
         "/cases/new_case",
         data={
-            "patient_number": unique_patient["patient_number"],
+            "patient_number": registered_patient["patient_number"],
             "case_notes": "Follow-up required",
         },
         files={"file": ("test_image.jpg", valid_image_bytes, "image/jpeg")},
@@ -136,3 +91,66 @@ def test_create_new_case(auth_token, unique_patient):
         200,
         201,
     ], f"Unexpected response: {response.json()}"
+
+
+@pytest.mark.order(8)
+def test_get_patients_batch(client, auth_token, registered_patient):
+    response = client.post(
+        "/users/patients/batch",
+        json=[registered_patient["patient_number"]],
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert (
+        response.status_code == 200
+    ), f"Unexpected response: {response.json()}"
+    patients = response.json().get("patients")
+    assert [p["patient_number"] for p in patients] == [
+        registered_patient["patient_number"]
+    ]
+
+
+@pytest.mark.order(9)
+def test_register_patients_bulk(
+    client, auth_token, registered_patient, unique_patient_number
+):
+    new_patient = {
+        **registered_patient,
+        "patient_number": unique_patient_number,
+    }
+    response = client.post(
+        "/users/register-patients-bulk",
+        json=[new_patient, registered_patient],
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert (
+        response.status_code == 201
+    ), f"Unexpected response: {response.json()}"
+    body = response.json()
+    assert [p["patient_number"] for p in body["patients"]] == [
+        new_patient["patient_number"]
+    ]
+    assert body["duplicates"] == [registered_patient["patient_number"]]
+
+
+@pytest.mark.order(10)
+def test_head_patient(client, auth_token, registered_patient):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = client.head(
+        f"/users/patients/{registered_patient['patient_number']}", headers=headers
+    )
+    assert response.status_code == 200
+    assert response.content == b""
+
+    response = client.head("/users/patients/1", headers=headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.order(11)
+def test_get_patients_past_end(client, auth_token):
+    response = client.get(
+        "/users/patients",
+        params={"skip": 10**9, "limit": 5},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"patients": []}
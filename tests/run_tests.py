@@ -14,8 +14,10 @@ if __name__ == "__main__":
     pytest_args = [
         "-v",  # Verbose mode
         "--tb=short",  # Show short tracebacks for failed tests
-        "--log-cli-level=INFO",  # Enable logging in CLI
         "--disable-warnings",  # Suppress warnings
+        "-n",  # Run tests in parallel with pytest-xdist
+        "auto",
+        "--dist=loadfile",  # Keep each module's ordered tests on one worker
         f"--rootdir={test_dir}",  # Set root directory for tests
     ]
 
@@ -3,7 +3,6 @@ import logging
 from app.config import config
 from app.middleware.authentication import AuthMiddleware
 from app.utils.authentication import create_access_token
-from app.utils.authentication import hash_password
 from app.utils.authentication import verify_password
 from app.utils.authentication import verify_token
 from fastapi import FastAPI
@@ -12,6 +11,9 @@ import pytest
 
 logger = logging.getLogger(__name__)
 
+# Security tests always exercise the real bcrypt implementation
+pytestmark = pytest.mark.real_bcrypt
+
 # Create a simple FastAPI app for middleware testing
 app = FastAPI()
 app.add_middleware(AuthMiddleware)
@@ -19,19 +21,19 @@ client = TestClient(app)
 
 
 @pytest.mark.order(1)
-def test_hash_password():
+def test_hash_password(hashed_secure_password):
     """Test password hashing function."""
     password = "securepassword"
-    hashed = hash_password(password)
+    hashed = hashed_secure_password
     assert isinstance(hashed, str)
     assert hashed != password  # Ensure it is hashed
 
 
 @pytest.mark.order(2)
-def test_verify_password():
+def test_verify_password(hashed_secure_password):
     """Test password verification function."""
     password = "securepassword"
-    hashed = hash_password(password)
+    hashed = hashed_secure_password
     assert verify_password(password, hashed) is True
     assert verify_password("wrongpassword", hashed) is False
 
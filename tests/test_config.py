@@ -47,3 +47,19 @@ def test_logging_enabled():
     ], "Logging should be enabled in tests!"
 
     logger.info("Logging is enabled in test mode.")
+
+
+@pytest.mark.order(5)
+def test_cache_clear(monkeypatch):
+    """Check cache_clear() makes accessors pick up environment changes."""
+    original = config.get_ml_api_url()
+    monkeypatch.setenv("ML_API_URL", "http://example.test/predict")
+    assert config.get_ml_api_url() == original, "Setting was not cached!"
+
+    config.cache_clear()
+    try:
+        assert config.get_ml_api_url() == "http://example.test/predict"
+    finally:
+        monkeypatch.undo()
+        config.cache_clear()
+    assert config.get_ml_api_url() == original
@@ -8,7 +8,6 @@ from app.config import config
 from app.schema.authentication import LoginRequest
 from app.utils.authentication import authenticate_doctor
 from app.utils.authentication import create_access_token
-from app.utils.authentication import hash_password
 from app.utils.authentication import verify_password
 from app.utils.authentication import verify_token
 import bcrypt
@@ -18,6 +17,9 @@ import pytest
 
 logger = logging.getLogger(__name__)
 
+# Security tests always exercise the real bcrypt implementation
+pytestmark = pytest.mark.real_bcrypt
+
 # Load environment variables
 SECRET_KEY = config.get_secret_key()
 ALGORITHM = config.get_algorithm()
@@ -28,10 +30,10 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(config.get_access_token_expiry())
 
 
 @pytest.mark.order(1)
-def test_hash_password():
+def test_hash_password(hashed_secure_password):
     """Test that a password is correctly hashed and is not equal to the original password."""
     password = "securepassword"
-    hashed_password = hash_password(password)
+    hashed_password = hashed_secure_password
 
     assert isinstance(hashed_password, str)
     assert (
@@ -41,10 +43,10 @@ def test_hash_password():
 
 
 @pytest.mark.order(2)
-def test_verify_password():
+def test_verify_password(hashed_secure_password):
     """Test password verification against a correct and incorrect password."""
     password = "securepassword"
-    hashed_password = hash_password(password)
+    hashed_password = hashed_secure_password
 
     assert verify_password(
         password, hashed_password
@@ -54,6 +56,12 @@ def test_verify_password():
     )  # Incorrect password should return False
 
 
+@pytest.mark.order(2)
+def test_verify_password_malformed_hash():
+    """Test a corrupt bcrypt hash is rejected instead of raising."""
+    assert not verify_password("securepassword", "$2b$12$corrupt")
+
+
 # ------------------- JWT Token Handling Tests ------------------- #
 
 
@@ -109,19 +117,37 @@ def test_verify_token():
         assert excinfo.detail == "Token has expired"
 
 
+@pytest.mark.order(4)
+def test_verify_token_rejects_tampered_tokens():
+    """Test that modified payloads and unsigned tokens are rejected."""
+    token = create_access_token({"user_id": "12345"})
+    header, _, signature = token.split(".")
+
+    forged_payload = jwt.encode({"user_id": "admin"}, "other", "HS256")
+    tampered = ".".join([header, forged_payload.split(".")[1], signature])
+    unsigned = jwt.encode({"user_id": "12345"}, None, algorithm="none")
+
+    for bad_token in (tampered, unsigned):
+        with pytest.raises(HTTPException) as excinfo:
+            verify_token(bad_token)
+        assert excinfo.value.status_code == 401
+
+
 # ------------------- User Authentication Tests ------------------- #
 
 
 @pytest.mark.order(5)
-@patch("app.models.doctor.get_doctor_by_email")
-def test_authenticate_doctor_success(mock_get_doctor_by_email):
+@patch("app.models.doctor.get_doctor_credentials")
+def test_authenticate_doctor_success(
+    mock_get_doctor_credentials, hashed_secure_password
+):
     """Test successful authentication of a doctor."""
     mock_doctor_data = {
         "doctor_id": "123",
         "email": "test@example.com",
-        "password": hash_password("securepassword"),
+        "password": hashed_secure_password,
     }
-    mock_get_doctor_by_email.return_value = mock_doctor_data
+    mock_get_doctor_credentials.return_value = mock_doctor_data
 
     login_data = LoginRequest(
         email="test@example.com", password="securepassword"
@@ -133,15 +159,17 @@ def test_authenticate_doctor_success(mock_get_doctor_by_email):
 
 
 @pytest.mark.order(6)
-@patch("app.models.doctor.get_doctor_by_email")
-def test_authenticate_doctor_invalid_password(mock_get_doctor_by_email):
+@patch("app.models.doctor.get_doctor_credentials")
+def test_authenticate_doctor_invalid_password(
+    mock_get_doctor_credentials, hashed_secure_password
+):
     """Test authentication failure due to incorrect password."""
     mock_doctor_data = {
         "doctor_id": "123",
         "email": "test@example.com",
-        "password": hash_password("securepassword"),
+        "password": hashed_secure_password,
     }
-    mock_get_doctor_by_email.return_value = mock_doctor_data
+    mock_get_doctor_credentials.return_value = mock_doctor_data
 
     login_data = LoginRequest(
         email="test@example.com", password="wrongpassword"
@@ -155,10 +183,10 @@ def test_authenticate_doctor_invalid_password(mock_get_doctor_by_email):
 
 
 @pytest.mark.order(7)
-@patch("app.models.doctor.get_doctor_by_email")
-def test_authenticate_doctor_invalid_email(mock_get_doctor_by_email):
+@patch("app.models.doctor.get_doctor_credentials")
+def test_authenticate_doctor_invalid_email(mock_get_doctor_credentials):
     """Test authentication failure due to non-existent email."""
-    mock_get_doctor_by_email.return_value = None  # Doctor not found
+    mock_get_doctor_credentials.return_value = None  # Doctor not found
 
     login_data = LoginRequest(
         email="notfound@example.com", password="securepassword"
@@ -173,10 +201,10 @@ def test_authenticate_doctor_invalid_email(mock_get_doctor_by_email):
 
 @pytest.mark.order(8)
 @patch(
-    "app.models.doctor.get_doctor_by_email",
+    "app.models.doctor.get_doctor_credentials",
     side_effect=Exception("Database connection error"),
 )
-def test_authenticate_doctor_exception(mock_get_doctor_by_email):
+def test_authenticate_doctor_exception(mock_get_doctor_credentials):
     """Test handling of unexpected errors during authentication."""
     login_data = LoginRequest(
         email="test@example.com", password="securepassword"
@@ -1,99 +1,44 @@
 from datetime import datetime
 from datetime import timezone
-import json
-import random
 import uuid
 
 from app.models.api_key import allocate_api_key
 from app.models.api_key import get_api_key
-from app.models.api_key import get_api_key_collection
 from app.models.case import get_case_by_id
-from app.models.case import get_case_collection
 from app.models.case import get_cases_by_doctor
 from app.models.case import get_cases_by_patient
-from app.models.doctor import create_doctor
 from app.models.doctor import get_all_doctors
-from app.models.doctor import get_doctor_by_email
 from app.models.doctor import get_doctor_by_id
-from app.models.patient import create_patient
 from app.models.patient import get_all_patients
-from app.models.patient import get_patient_by_patient_number
 from app.models.patient import get_patient_id
-from app.schema.doctor import DoctorCreate
-from app.schema.patient import PatientCreate
+import orjson
 import pytest
 
+# Fixed timestamp; these tests never depend on the real time.
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-def generate_unique_email():
-    """Generates a unique email using a UUID."""
-    return f"testdoctor_{uuid.uuid4().hex[:8]}@example.com"
 
-
-def generate_unique_patient_number():
-    """Generates a unique 8-digit patient number."""
-    return random.randint(10000000, 99999999)
-
-
-# Fixture to create a new doctor with a unique email for each test run.
-@pytest.fixture(scope="module")
-def new_doctor():
-    email = generate_unique_email()
-    doctor_info = {
-        "name": "Dr. Test",
-        "email": email,
-        "password": "securepassword",
-    }
-    response = create_doctor(DoctorCreate(**doctor_info))
-    # Verify creation via status code
-    assert response.status_code == 201
-    doctor = get_doctor_by_email(email)
-    if hasattr(doctor, "body"):
-        doctor = json.loads(doctor.body.decode("utf-8"))
-    assert doctor is not None
-    return doctor
-
-
-# Fixture to create a new patient with a unique patient number for each test run.
-@pytest.fixture(scope="module")
-def new_patient(new_doctor):
-    patient_number = generate_unique_patient_number()
-    patient_info = {
-        "patient_number": patient_number,
-        "name": "John Doe",
-        "date_of_birth": datetime(1985, 8, 25, tzinfo=timezone.utc),
-        "gender": "Uk",  # Adjust as needed (e.g., "UK")
-        "occupation": "Engineer",
-        "ethnicity": "Hispanic",
-        "notes": ["Allergic to penicillin"],
-    }
-    response = create_patient(
-        PatientCreate(**patient_info), {"doctor_id": new_doctor["doctor_id"]}
-    )
-    assert response.status_code == 201
-    patient = get_patient_by_patient_number(patient_number)
-    if hasattr(patient, "body"):
-        patient = json.loads(patient.body.decode("utf-8"))
-    assert patient is not None
-    return patient
+def _body(response):
+    """Parses a JSON response body without decoding it to str first."""
+    return orjson.loads(response.body)
 
 
 @pytest.mark.order(1)
-def test_allocate_api_key():
+def test_allocate_api_key(fresh_uuid, api_keys_collection):
     """Test allocating an API key for a doctor."""
-    doctor_id = str(uuid.uuid4())
+    doctor_id = str(fresh_uuid)
     api_key = allocate_api_key(doctor_id)
     assert isinstance(api_key, str)
 
-    api_keys = get_api_key_collection()
-    stored_key = api_keys.find_one({"doctor_id": doctor_id})
+    stored_key = api_keys_collection.find_one({"doctor_id": doctor_id})
     assert stored_key is not None
     assert stored_key["api_key"] == api_key
 
 
 @pytest.mark.order(2)
-def test_get_api_key():
+def test_get_api_key(fresh_uuid):
     """Test retrieving an API key for a doctor."""
-    doctor_id = str(uuid.uuid4())
+    doctor_id = str(fresh_uuid)
     allocate_api_key(doctor_id)
     retrieved_key = get_api_key(doctor_id)
     assert isinstance(retrieved_key, str)
@@ -111,8 +56,6 @@ def test_get_doctor_by_id(new_doctor):
     """Test retrieving a doctor by ID."""
     doctor_id = new_doctor["doctor_id"]
     retrieved_doctor = get_doctor_by_id(doctor_id)
-    if hasattr(retrieved_doctor, "body"):
-        retrieved_doctor = json.loads(retrieved_doctor.body.decode("utf-8"))
     assert retrieved_doctor is not None
     assert retrieved_doctor["email"] == new_doctor["email"]
 
@@ -122,7 +65,7 @@ def test_get_all_doctors():
     """Test retrieving all doctors."""
     response = get_all_doctors()
     assert response.status_code == 200
-    data = json.loads(response.body.decode("utf-8"))
+    data = _body(response)
     assert isinstance(data["doctors"], list)
 
 
@@ -139,75 +82,79 @@ def test_get_patient_id(new_patient):
     # Use the nested structure: patient_number is inside new_patient["patient"]
     patient_number = new_patient["patient"]["patient_number"]
     patient_id = get_patient_id(patient_number)
-    assert isinstance(patient_id, (int, str))
+    assert isinstance(patient_id, uuid.UUID)
 
 
 @pytest.mark.order(8)
-def test_get_all_patients():
+async def test_get_all_patients():
     """Test retrieving all patients."""
     response = get_all_patients()
     assert response.status_code == 200
-    data = json.loads(response.body.decode("utf-8"))
+    # StreamingResponse wraps the sync generator in an async iterator.
+    chunks = [chunk async for chunk in response.body_iterator]
+    data = orjson.loads(b"".join(chunks))
     assert isinstance(data["patients"], list)
 
 
-@pytest.mark.order(9)
-def test_get_case_by_id(new_doctor, new_patient):
-    """Test retrieving a case by its ID."""
-    cases = get_case_collection()
-    test_case = {
-        "case_id": str(uuid.uuid4()),
-        "doctor_id": new_doctor["doctor_id"],
-        # Access patient_id from the nested dictionary.
-        "patient_id": new_patient["patient"]["patient_id"],
-        "diagnosis": {"malignant": 0.8, "benign": 0.2},
-        "notes": ["Follow-up required"],
-        "created_at": datetime.now(timezone.utc),
+@pytest.fixture(scope="module")
+def seeded_cases(new_doctor, new_patient, uuid_pool, cases_collection):
+    """Inserts the case tests' documents in one batch and removes them after.
+
+    Returns:
+        dict: The seeded cases keyed by the test that reads them.
+    """
+    patient = new_patient["patient"]
+    cases = {
+        "by_id": {
+            "case_id": str(uuid_pool.pop()),
+            "doctor_id": new_doctor["doctor_id"],
+            "patient_id": patient["patient_id"],
+            "diagnosis": {"malignant": 0.8, "benign": 0.2},
+            "notes": ["Follow-up required"],
+            "created_at": _NOW,
+        },
+        "by_patient": {
+            "case_id": str(uuid_pool.pop()),
+            "doctor_id": patient.get("doctor_id", "dummy"),
+            "patient_id": patient["patient_id"],
+            "diagnosis": {"malignant": 0.9, "benign": 0.1},
+            "notes": ["Test case for get_cases_by_patient"],
+            "created_at": _NOW,
+        },
     }
-    cases.insert_one(test_case)
+    cases_collection.insert_many(list(cases.values()), ordered=False)
+    yield cases
+    cases_collection.delete_many(
+        {"case_id": {"$in": [case["case_id"] for case in cases.values()]}}
+    )
 
-    response = get_case_by_id(test_case["case_id"])
+
+@pytest.mark.order(9)
+def test_get_case_by_id(seeded_cases):
+    """Test retrieving a case by its ID."""
+    response = get_case_by_id(seeded_cases["by_id"]["case_id"])
     assert response.status_code == 200
-    data = json.loads(response.body.decode("utf-8"))
+    data = _body(response)
     # Assuming the response returns a key "case" with the test case data.
     assert data["notes"] == ["Follow-up required"]
 
-    # Cleanup: remove the test case.
-    cases.delete_one({"case_id": test_case["case_id"]})
-
 
 @pytest.mark.order(10)
 def test_get_cases_by_doctor(new_doctor):
     """Test retrieving cases assigned to a doctor."""
     response = get_cases_by_doctor(new_doctor)
     assert response.status_code == 200
-    data = json.loads(response.body.decode("utf-8"))
+    data = _body(response)
     assert isinstance(data["cases"], list)
 
 
 @pytest.mark.order(11)
-def test_get_cases_by_patient(new_patient):
+def test_get_cases_by_patient(new_patient, seeded_cases):
     """Test retrieving cases assigned to a patient."""
-    # Insert a test case for the patient to ensure at least one case exists.
-    cases = get_case_collection()
-    test_case = {
-        "case_id": str(uuid.uuid4()),
-        "doctor_id": new_patient["patient"].get("doctor_id", "dummy"),
-        "patient_id": new_patient["patient"]["patient_id"],
-        "diagnosis": {"malignant": 0.9, "benign": 0.1},
-        "notes": ["Test case for get_cases_by_patient"],
-        "created_at": datetime.now(timezone.utc),
-    }
-    cases.insert_one(test_case)
-
     response = get_cases_by_patient(new_patient["patient"]["patient_id"])
     assert response.status_code == 200
-    data = json.loads(response.body.decode("utf-8"))
+    data = _body(response)
     assert isinstance(data["cases"], list)
-    # Ensure the inserted test case is present.
-    assert any(
-        case["case_id"] == test_case["case_id"] for case in data["cases"]
-    )
-
-    # Cleanup: remove the test case.
-    cases.delete_one({"case_id": test_case["case_id"]})
+    # Ensure the seeded test case is present.
+    case_id = seeded_cases["by_patient"]["case_id"]
+    assert case_id in {case["case_id"] for case in data["cases"]}
@@ -0,0 +1,36 @@
+from app.utils.request_cache import end_request_cache
+from app.utils.request_cache import request_cached
+from app.utils.request_cache import start_request_cache
+
+
+def test_request_cached_memoizes_within_request():
+    """Test repeated lookups in one request hit the wrapped function once."""
+    calls = []
+
+    @request_cached
+    def lookup(key):
+        calls.append(key)
+        return {"key": key}
+
+    token = start_request_cache()
+    try:
+        assert lookup(1) is lookup(1)
+        lookup(2)
+    finally:
+        end_request_cache(token)
+
+    assert calls == [1, 2]
+
+
+def test_request_cached_passthrough_outside_request():
+    """Test lookups outside a request are never cached."""
+    calls = []
+
+    @request_cached
+    def lookup(key):
+        calls.append(key)
+        return key
+
+    lookup(1)
+    lookup(1)
+    assert calls == [1, 1]
@@ -3,53 +3,56 @@ from datetime import timezone
 import uuid
 
 from app.schema.api_key import APIKey
+from app.schema.authentication import LoginRequest
 from app.schema.case import Case
 from app.schema.case import DiagnosisResult
 from app.schema.doctor import DoctorCreate
 from app.schema.doctor import DoctorDB
+from app.schema.images import UploadImage
 from app.schema.patient import Patient
 from app.schema.patient import PatientCreate
+from pydantic import ValidationError
 import pytest
 
+# Fixed timestamp; these tests never depend on the real time.
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
-@pytest.mark.order(1)
 def test_api_key_schema():
     """Test APIKey schema instantiation."""
     api_key = APIKey(
-        api_key="test_api_key", expired_date=datetime.now(timezone.utc)
+        api_key="test_api_key", expired_date=_NOW
     )
     assert api_key.api_key == "test_api_key"
     assert isinstance(api_key.expired_date, datetime)
 
 
-@pytest.mark.order(2)
 def test_diagnosis_result_schema():
     """Test DiagnosisResult schema instantiation."""
     diagnosis = DiagnosisResult(malignant=0.8, benign=0.2)
-    assert diagnosis.malignant == 0.8
-    assert diagnosis.benign == 0.2
+    assert diagnosis["malignant"] == 0.8
+    assert diagnosis["benign"] == 0.2
 
 
-@pytest.mark.order(3)
-def test_case_schema():
+def test_case_schema(uuid_pool):
     """Test Case schema instantiation."""
     case = Case(
-        doctor_id=uuid.uuid4(),
-        patient_id=uuid.uuid4(),
+        doctor_id=str(uuid_pool.pop()),
+        patient_id=uuid_pool.pop(),
         diagnosis=DiagnosisResult(malignant=0.9, benign=0.1),
         notes=["Suspicious mole detected"],
-        created_at=datetime.now(timezone.utc),
-        case_id=uuid.uuid4(),
+        created_at=_NOW,
+        case_id=str(uuid_pool.pop()),
         image_id="test_image_id",
     )
-    assert isinstance(case.doctor_id, uuid.UUID)
+    assert isinstance(case.doctor_id, str)
+    assert isinstance(case.case_id, str)
     assert isinstance(case.patient_id, uuid.UUID)
-    assert isinstance(case.diagnosis, DiagnosisResult)
-    assert case.notes == ["Suspicious mole detected"]
+    assert case.diagnosis == {"malignant": 0.9, "benign": 0.1}
+    assert case.notes == ("Suspicious mole detected",)
 
 
-@pytest.mark.order(4)
-def test_doctor_schema():
+def test_doctor_schema(fresh_uuid):
     """Test DoctorCreate and DoctorDB schema instantiation."""
     doctor_create = DoctorCreate(
         name="Dr. Jane Doe", email="jane.doe@example.com", password="securepass"
@@ -58,17 +61,16 @@ def test_doctor_schema():
     assert doctor_create.email == "jane.doe@example.com"
 
     doctor_db = DoctorDB(
-        doctor_id=uuid.uuid4(),
+        doctor_id=str(fresh_uuid),
         name="Dr. Jane Doe",
         email="jane.doe@example.com",
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
     )
-    assert isinstance(doctor_db.doctor_id, uuid.UUID)
+    assert isinstance(doctor_db.doctor_id, str)
     assert isinstance(doctor_db.created_at, datetime)
 
 
-@pytest.mark.order(5)
-def test_patient_schema():
+def test_patient_schema(fresh_uuid):
     """Test PatientCreate and Patient schema instantiation."""
     patient_create = PatientCreate(
         patient_number=12345,
@@ -81,10 +83,11 @@ def test_patient_schema():
         notes=["Allergic to penicillin"],
     )
     assert patient_create.name == "John Doe"
-    assert patient_create.gender == "Male"
+    assert patient_create.gender == "male"
+    assert patient_create.country == "Uk"
 
     patient = Patient(
-        patient_id=uuid.uuid4(),
+        patient_id=fresh_uuid,
         patient_number=12345,
         name="John Doe",
         date_of_birth=datetime(1985, 8, 25, tzinfo=timezone.utc),
@@ -93,7 +96,43 @@ def test_patient_schema():
         occupation="Engineer",
         ethnicity="Hispanic",
         notes=["Allergic to penicillin"],
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
     )
     assert isinstance(patient.patient_id, uuid.UUID)
     assert isinstance(patient.created_at, datetime)
+
+
+def test_upload_image_schema():
+    """Test UploadImage rejects empty image data."""
+    image = UploadImage(image_bytes=b"data", image_name="scan.png")
+    assert image.image_name == "scan.png"
+
+    with pytest.raises(ValueError):
+        UploadImage(image_bytes=b"", image_name="scan.png")
+
+
+def test_patient_create_rejects_unknown_fields():
+    """Test PatientCreate forbids undeclared fields and is immutable."""
+    patient_data = {
+        "patient_number": 12345,
+        "name": "John Doe",
+        "date_of_birth": "1985-08-25",
+        "gender": "Male",
+    }
+    with pytest.raises(ValidationError):
+        PatientCreate(**patient_data, is_admin=True)
+
+    patient = PatientCreate(**patient_data)
+    with pytest.raises(ValidationError):
+        patient.name = "Jane Doe"
+
+
+def test_email_normalized_on_validation():
+    """Test that login and doctor emails are lower-cased during validation."""
+    login = LoginRequest(email="Jane.Doe@Example.COM", password="secret")
+    assert login.email == "jane.doe@example.com"
+
+    doctor = DoctorCreate(
+        name="Dr. Jane Doe", email="Jane.Doe@Example.COM", password="secret"
+    )
+    assert doctor.email == "jane.doe@example.com"
@@ -0,0 +1,30 @@
+"""Benchmarks for the schema serialization round trips.
+
+Save a baseline and compare later runs against it to catch regressions:
+
+    pytest tests/unit/test_serialization_bench.py --benchmark-autosave
+    pytest tests/unit/test_serialization_bench.py \
+        --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+from app.schema.case import Case
+from app.schema.patient import PatientCreate
+from tests.test_serialization import _CASE_DATA
+from tests.test_serialization import _PATIENT_DATA
+
+
+def _round_trip(model, data):
+    """Validates data, dumps it to JSON and validates the JSON back."""
+    return model.model_validate_json(model(**data).model_dump_json())
+
+
+def test_bench_case_round_trip(benchmark):
+    """Benchmark a Case validate -> dump -> validate round trip."""
+    case = benchmark(_round_trip, Case, _CASE_DATA)
+    assert case == Case(**_CASE_DATA)
+
+
+def test_bench_patient_round_trip(benchmark):
+    """Benchmark a PatientCreate validate -> dump -> validate round trip."""
+    patient = benchmark(_round_trip, PatientCreate, _PATIENT_DATA)
+    assert patient == PatientCreate(**_PATIENT_DATA)